@@ -1,16 +1,19 @@
 import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import schedule
 import hashlib
 from datetime import datetime, timedelta
-from slack_sdk import WebClient
+from typing import Optional
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 from .coda_service import CodaService
 from .org_metadata_service import OrgMetadataService
+from .utils import Deduplicator, RateLimitedWebClient, TTLDict, enable_fast_slack_json, logger
 from .events import (
+    handle_events,
     handle_interactive_components,
     handle_slash_command,
     handle_mentor_response,
@@ -23,12 +26,60 @@ from .events import (
     handle_open_view_blockers_modal
 )
 
+# Static health check reminder payload, built once at import instead of per user
+_HEALTH_CHECK_REMINDER_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "💚 *How are you feeling today?*\n\nTake a moment to check in with yourself and let the team know how you're doing."
+        }
+    },
+    {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "😊 Great", "emoji": True},
+                "action_id": "great",
+                "style": "primary"
+            },
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "😐 Okay", "emoji": True},
+                "action_id": "okay"
+            },
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "😕 Not great", "emoji": True},
+                "action_id": "not_great",
+                "style": "danger"
+            }
+        ]
+    }
+]
+
 class DailyStandupBot:
     """Main bot class for handling daily standups and health checks."""
     
     def __init__(self, slack_token: str, app_token: str, coda_doc_id: str, coda_api_token: str):
-        self.client = WebClient(token=slack_token)
+        # Use orjson for request bodies (blocks) when available
+        enable_fast_slack_json()
+        # chat_postMessage is rate limited per channel to stay under Slack's posting limits;
+        # the timeout bounds how long a stalled call can hold a worker thread
+        self.client = RateLimitedWebClient(
+            token=slack_token,
+            timeout=int(os.getenv('SLACK_API_TIMEOUT', '10'))
+        )
         self.app_token = app_token
+        
+        # Resolve our own identity once; message handlers compare against it per event
+        try:
+            self.bot_user_id = self.client.auth_test()["user_id"]
+        except Exception as e:
+            print(f"⚠️ Could not resolve bot user ID via auth.test, using SLACK_BOT_USER_ID: {e}")
+            self.bot_user_id = os.getenv('SLACK_BOT_USER_ID')
+        self.bot_mention = f"<@{self.bot_user_id}>"
         self.config = type('Config', (), {
             'SLACK_ESCALATION_CHANNEL': os.getenv('SLACK_ESCALATION_CHANNEL', 'leads')
         })()
@@ -38,23 +89,62 @@ class DailyStandupBot:
         self.org_metadata = OrgMetadataService()
         
         # Initialize Socket Mode client
+        # Requests are dispatched on the client's worker pool, so a slow handler
+        # (Coda, users.info) doesn't hold up the events queued behind it
         self.socket_client = SocketModeClient(
             app_token=app_token,
-            web_client=self.client
+            web_client=self.client,
+            concurrency=int(os.getenv('SOCKET_MODE_CONCURRENCY', '10'))
         )
+        self.socket_client.socket_mode_request_listeners.append(self._on_socket_request)
+        
+        # Track active blockers for follow-up (a week is well past the followup window)
+        self.active_blockers = TTLDict(maxsize=2048, ttl_seconds=7 * 86400)
         
-        # Track active blockers for follow-up
-        self.active_blockers = {}
+        # Pending data for multi-step forms; abandoned forms expire after an hour
+        self.kr_pending_data = TTLDict(maxsize=1024, ttl_seconds=3600)
+        self.blocker_pending_data = TTLDict(maxsize=1024, ttl_seconds=3600)
         
-        # Pending data for multi-step forms
-        self.kr_pending_data = {}
-        self.blocker_pending_data = {}
+        # Expiring dedup state (Redis-backed when REDIS_URL is set)
+        self.processed_events = Deduplicator('evt', ttl_seconds=300)
+        self.processed_messages = Deduplicator('msg', ttl_seconds=86400)
+        self.health_check_responses = Deduplicator('hc', ttl_seconds=86400)
+        self.standup_responses = Deduplicator('standup', ttl_seconds=86400)
+        
+        # Standup and followup tracking, bounded so old days don't stay in memory
+        # (Redis-backed when REDIS_URL is set, so several bot processes share it)
+        self.active_standups = TTLDict(maxsize=512, ttl_seconds=48 * 3600, prefix='standup_msg')
+        # Holds the single 'ts' entry behind latest_standup_ts
+        self._latest_standup = TTLDict(maxsize=1, ttl_seconds=48 * 3600, prefix='standup_latest')
+        self.user_responses = TTLDict(maxsize=2048, ttl_seconds=24 * 3600, prefix='resp')
+        # Reverse index: followup message ts -> user_id, for O(1) reaction lookups
+        self.followup_ts_to_user = TTLDict(maxsize=2048, ttl_seconds=24 * 3600, prefix='followup_ts')
+        
+        # user_id -> users.info payload, so repeat lookups skip the API round-trip.
+        # team_join/user_change events invalidate it; the TTL is only a fallback
+        self._user_cache = TTLDict(maxsize=10000, ttl_seconds=3600)
+        # Active human members from users_list; membership changes rarely
+        self._active_users_cache = None
+        self._active_users_cache_time = 0
+        
+        # Channel name -> ID, so posts go by ID instead of Slack resolving "#name" each time
+        self._channel_id_cache = {}
+        self._channel_id_cache_time = 0
         
         # Auto-assign roles on startup
         self._assign_roles_on_startup()
         
         print("🤖 Starting Daily Standup Bot in Socket Mode...")
     
+    @property
+    def latest_standup_ts(self) -> Optional[str]:
+        """Timestamp of the most recent standup message (shared between processes with Redis)."""
+        return self._latest_standup.get('ts')
+    
+    @latest_standup_ts.setter
+    def latest_standup_ts(self, ts: str):
+        self._latest_standup['ts'] = ts
+    
     def _assign_roles_on_startup(self):
         """Auto-assign roles to all users on startup."""
         try:
@@ -68,19 +158,15 @@ class DailyStandupBot:
         try:
             print("🔄 Starting auto-role assignment for all users...")
             
-            # Get all users
-            response = self.client.users_list()
-            if not response['ok']:
+            # Get all active human users (paginated, and cached for the 9:00 sends)
+            users = self._get_active_human_users()
+            if not users:
                 print("❌ Failed to get users list")
                 return
             
-            users = response['users']
             assigned_count = 0
             
             for user in users:
-                if user.get('is_bot') or user.get('is_app_user') or user.get('deleted'):
-                    continue
-                
                 try:
                     user_id = user['id']
                     user_name = user.get('real_name', user.get('name', 'Unknown'))
@@ -111,13 +197,12 @@ class DailyStandupBot:
             roles = []
             
             # Get user info from Slack
-            user_info = self.client.users_info(user_id=user_id)
-            if user_info['ok']:
-                user = user_info['user']
+            user = self.get_user(user_id)
+            if user:
                 profile = user.get('profile', {})
                 
-                print(f"🔍 DEBUG: get_user_info called with user_id: {user_id}")
-                print(f"🔍 DEBUG: users_info API response: {user_info}")
+                logger.debug("get_user_info called with user_id: %s", user_id)
+                logger.debug("users_info API response: %s", user)
                 
                 # Extract user data
                 user_data_extracted = {
@@ -143,7 +228,7 @@ class DailyStandupBot:
                     'profile': profile
                 }
                 
-                print(f"🔍 DEBUG: Extracted user data: {user_data_extracted}")
+                logger.debug("Extracted user data: %s", user_data_extracted)
                 
                 # Analyze Slack profile
                 print(f"🔍 Analyzing Slack profile for user {user_id}")
@@ -186,48 +271,49 @@ class DailyStandupBot:
             print("🔌 Starting Socket Mode client...")
             self.socket_client.connect()
             
-            # Keep the bot running
-            while True:
-                try:
-                    # Process Socket Mode requests
-                    request = self.socket_client.recv()
-                    if request.type == SocketModeRequest.TYPE:
-                        self._handle_socket_request(request)
-                except Exception as e:
-                    print(f"❌ Error in Socket Mode loop: {e}")
-                    time.sleep(1)
+            # Keep the bot running; requests arrive on the client's worker threads
+            threading.Event().wait()
                     
         except Exception as e:
             print(f"❌ Error starting Socket Mode client: {e}")
     
+    def _on_socket_request(self, client: SocketModeClient, request: SocketModeRequest):
+        """Socket Mode listener; runs on one of the client's worker threads."""
+        self._handle_socket_request(request)
+    
     def _handle_socket_request(self, request: SocketModeRequest):
         """Handle incoming Socket Mode requests."""
+        acked = False
         try:
-            if request.type == "events_api":
-                # Handle events
-                event = request.payload.get("event", {})
-                event_type = event.get("type")
-                
-                if event_type == "message":
-                    # Handle message events
-                    pass
-                    
-            elif request.type == "interactive":
-                # Handle interactive components (buttons, modals)
+            payload_type = request.payload.get('type')
+            
+            if request.type == "interactive" and payload_type != 'block_actions':
+                # Modal submissions answer with response_action, so reply with the handler's result
                 response = handle_interactive_components(self, request.payload)
                 self.socket_client.send_socket_mode_response(SocketModeResponse(request.id, response))
-                
+                return
+            
+            # Everything else takes an empty ack (Slack ignores the body), sent before the
+            # handler's API calls so Slack doesn't time out and redeliver while we work
+            self.socket_client.send_socket_mode_response(SocketModeResponse(request.id))
+            acked = True
+            
+            if request.type == "events_api":
+                # A timeout retry means Slack missed our ack, not that the original
+                # delivery failed; that one is already being handled, so just ack
+                if request.retry_attempt and request.retry_reason == "timeout":
+                    print(f"⚠️ Skipping Slack timeout retry #{request.retry_attempt} for envelope {request.envelope_id}")
+                    return
+                handle_events(self, request.payload)
+            elif request.type == "interactive":
+                handle_interactive_components(self, request.payload)
             elif request.type == "slash_commands":
-                # Handle slash commands
-                response = handle_slash_command(self, request.payload)
-                self.socket_client.send_socket_mode_response(SocketModeResponse(request.id, response))
-                
-            else:
-                # Acknowledge unknown request types
-                self.socket_client.send_socket_mode_response(SocketModeResponse(request.id, {"text": "OK"}))
+                handle_slash_command(self, request.payload)
                 
         except Exception as e:
             print(f"❌ Error handling Socket Mode request: {e}")
+            if acked:
+                return
             # Send error response
             try:
                 self.socket_client.send_socket_mode_response(SocketModeResponse(request.id, {"text": "Error"}))
@@ -248,11 +334,16 @@ class DailyStandupBot:
             # Schedule blocker followup check every minute (for testing)
             schedule.every(1).minutes.do(self._check_blocker_followups)
             
-            # Start scheduler in background thread
+            # Drop expired standup/followup tracking entries
+            schedule.every().hour.do(self._expire_tracking_state)
+            
+            # Start scheduler in background thread; sleep until the next job is due
+            # instead of waking on a fixed interval
             def run_scheduler():
                 while True:
                     schedule.run_pending()
-                    time.sleep(60)  # Check every minute
+                    idle_seconds = schedule.idle_seconds()
+                    time.sleep(60 if idle_seconds is None else max(1, idle_seconds))
             
             scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
             scheduler_thread.start()
@@ -266,23 +357,68 @@ class DailyStandupBot:
         except Exception as e:
             print(f"❌ Error starting scheduler: {e}")
     
-    def _send_daily_standup(self):
-        """Send daily standup reminder."""
-        try:
-            # Get all users
-            response = self.client.users_list()
+    def _expire_tracking_state(self):
+        """Evict expired entries from the bounded tracking dicts."""
+        self.active_standups.expire()
+        self.user_responses.expire()
+        self.followup_ts_to_user.expire()
+        self.active_blockers.expire()
+        self.kr_pending_data.expire()
+        self.blocker_pending_data.expire()
+    
+    def _get_active_human_users(self, cache_seconds: int = 3600):
+        """Return users_list members that are real, active people, cached for cache_seconds."""
+        current_time = time.time()
+        if self._active_users_cache is not None and current_time - self._active_users_cache_time < cache_seconds:
+            return self._active_users_cache
+        
+        users = []
+        cursor = None
+        while True:
+            response = self.client.users_list(limit=1000, cursor=cursor)
             if not response['ok']:
-                return
+                return self._active_users_cache or []
             
-            users = response['users']
-            for user in users:
+            for user in response['users']:
                 if user.get('is_bot') or user.get('is_app_user') or user.get('deleted'):
                     continue
-                
-                try:
-                    self.send_dm(user['id'], "📅 *Daily Standup Reminder*\n\nIt's time for your daily standup! Use `/checkin` to submit your update.")
-                except Exception as e:
-                    print(f"⚠️ Error sending standup reminder to {user.get('name', 'Unknown')}: {e}")
+                users.append(user)
+                # Same record users.info returns, so seed the lookup cache while we have it
+                self._user_cache[user['id']] = user
+            
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+        
+        self._active_users_cache = users
+        self._active_users_cache_time = current_time
+        return users
+    
+    def _fan_out_to_users(self, users, send, label: str, max_workers: int = 8):
+        """Call send(user_id) for every user concurrently, logging failures per user.
+        
+        The rate-limited client keeps the burst within Slack's posting limits.
+        """
+        def send_one(user):
+            try:
+                send(user['id'])
+            except Exception as e:
+                print(f"⚠️ Error sending {label} to {user.get('name', 'Unknown')}: {e}")
+        
+        if not users:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(users))) as executor:
+            list(executor.map(send_one, users))
+    
+    def _send_daily_standup(self):
+        """Send daily standup reminder."""
+        try:
+            users = self._get_active_human_users()
+            self._fan_out_to_users(
+                users,
+                lambda user_id: self.send_dm(user_id, "📅 *Daily Standup Reminder*\n\nIt's time for your daily standup! Use `/checkin` to submit your update."),
+                "standup reminder"
+            )
                     
         except Exception as e:
             print(f"❌ Error sending daily standup: {e}")
@@ -290,20 +426,8 @@ class DailyStandupBot:
     def _send_health_check(self):
         """Send health check reminder."""
         try:
-            # Get all users
-            response = self.client.users_list()
-            if not response['ok']:
-                return
-            
-            users = response['users']
-            for user in users:
-                if user.get('is_bot') or user.get('is_app_user') or user.get('deleted'):
-                    continue
-                
-                try:
-                    self.send_health_check_reminder(user['id'])
-                except Exception as e:
-                    print(f"⚠️ Error sending health check to {user.get('name', 'Unknown')}: {e}")
+            users = self._get_active_human_users()
+            self._fan_out_to_users(users, self.send_health_check_reminder, "health check")
                     
         except Exception as e:
             print(f"❌ Error sending health check: {e}")
@@ -311,37 +435,7 @@ class DailyStandupBot:
     def send_health_check_reminder(self, user_id: str):
         """Send health check reminder to a specific user."""
         try:
-            blocks = [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "💚 *How are you feeling today?*\n\nTake a moment to check in with yourself and let the team know how you're doing."
-                    }
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {"type": "plain_text", "text": "😊 Great", "emoji": True},
-                            "action_id": "great",
-                            "style": "primary"
-                        },
-                        {
-                            "type": "button",
-                            "text": {"type": "plain_text", "text": "😐 Okay", "emoji": True},
-                            "action_id": "okay"
-                        },
-                        {
-                            "type": "button",
-                            "text": {"type": "plain_text", "text": "😕 Not great", "emoji": True},
-                            "action_id": "not_great",
-                            "style": "danger"
-                        }
-                    ]
-                }
-            ]
+            blocks = _HEALTH_CHECK_REMINDER_BLOCKS
             
             self.client.chat_postMessage(
                 channel=user_id,
@@ -360,9 +454,9 @@ class DailyStandupBot:
             
             # Check if it's time for follow-ups
             BLOCKER_FOLLOWUP_DELAY_HOURS = 2 / 60  # 2 minutes for testing
-            print(f"🔍 DEBUG: BLOCKER_FOLLOWUP_DELAY_HOURS = {BLOCKER_FOLLOWUP_DELAY_HOURS}")
-            print(f"🔍 DEBUG: Current time: {current_time}")
-            print(f"🔍 DEBUG: Tracked blockers: {list(self.active_blockers.keys())}")
+            logger.debug("BLOCKER_FOLLOWUP_DELAY_HOURS = %s", BLOCKER_FOLLOWUP_DELAY_HOURS)
+            logger.debug("Current time: %s", current_time)
+            logger.debug("Tracked blockers: %s", list(self.active_blockers))
             
             # Load unresolved blockers from Coda
             print("🔍 Loading unresolved blockers from Coda...")
@@ -456,19 +550,27 @@ class DailyStandupBot:
     def escalate_blocker_with_details(self, user_id: str, user_name: str, blocker_description: str, kr_name: str, urgency: str = "medium", notes: str = "", sprint_number: Optional[int] = None):
         """Escalate a blocker to the team with full details."""
         try:
-            # Save to Coda first
+            # Save to Coda in parallel with the Slack escalation post below
+            def save_to_coda():
+                try:
+                    success = self.coda.add_blocker(user_id, user_name, blocker_description, kr_name, urgency, notes, sprint_number)
+                    if success:
+                        print(f"✅ Blocker saved to Coda for {user_name}")
+                    else:
+                        print(f"⚠️ Failed to save blocker to Coda for {user_name}")
+                except Exception as e:
+                    print(f"⚠️ Error saving blocker to Coda for {user_name}: {e}")
+            
+            coda_thread = None
             if self.coda:
-                success = self.coda.add_blocker(user_id, user_name, blocker_description, kr_name, urgency, notes, sprint_number)
-                if success:
-                    print(f"✅ Blocker saved to Coda for {user_name}")
-                else:
-                    print(f"⚠️ Failed to save blocker to Coda for {user_name}")
+                coda_thread = threading.Thread(target=save_to_coda, daemon=True)
+                coda_thread.start()
             
             # Track blocker for follow-up
             self.track_blocker_for_followup(user_id, kr_name)
             
             # Escalate to team channel
-            escalation_channel = f"#{self.config.SLACK_ESCALATION_CHANNEL}" if self.config.SLACK_ESCALATION_CHANNEL else "#leads"
+            escalation_channel = self.get_channel_id(self.config.SLACK_ESCALATION_CHANNEL or "leads")
             
             # Create escalation message
             urgency_emoji = {
@@ -528,6 +630,9 @@ class DailyStandupBot:
             
             print(f"✅ Blocker escalated to {escalation_channel} for {user_name}")
             
+            if coda_thread:
+                coda_thread.join()
+            
         except Exception as e:
             print(f"❌ Error escalating blocker: {e}")
     
@@ -559,18 +664,67 @@ class DailyStandupBot:
         except Exception as e:
             print(f"❌ Error sending DM: {e}")
     
+    def get_user(self, user_id: str) -> dict:
+        """Get a user's users.info record, cached until the user changes (at most an hour)."""
+        user = self._user_cache.get(user_id)
+        if user is None:
+            user = self.client.users_info(user=user_id)['user']
+            self._user_cache[user_id] = user
+        return user
+    
+    def invalidate_user_cache(self, user: dict = None):
+        """Drop cached user data after a team_join/user_change event.
+        
+        The event carries the full users.info record, so it replaces the cached one.
+        """
+        if user:
+            self._user_cache[user['id']] = user
+        self._active_users_cache_time = 0
+    
+    def invalidate_channel_cache(self):
+        """Force the channel name -> ID map to reload after a channel_* event."""
+        self._channel_id_cache_time = 0
+    
     def get_user_name(self, user_id: str) -> str:
         """Get a user's display name."""
         try:
-            response = self.client.users_info(user_id=user_id)
-            if response['ok']:
-                user = response['user']
-                return user.get('real_name') or user.get('name', 'Unknown')
-            return 'Unknown'
+            user = self.get_user(user_id)
+            return user.get('real_name') or user.get('name', 'Unknown')
         except Exception as e:
             print(f"❌ Error getting user name: {e}")
             return 'Unknown'
     
+    def get_channel_id(self, channel_name: str, cache_seconds: int = 3600) -> str:
+        """Resolve a channel name to its ID, falling back to '#name' if it can't be found."""
+        channel_name = channel_name.lstrip('#')
+        current_time = time.time()
+        try:
+            # Refresh the name -> ID map from conversations_list when stale
+            if current_time - self._channel_id_cache_time >= cache_seconds:
+                channel_ids = {}
+                cursor = None
+                while True:
+                    response = self.client.conversations_list(
+                        types='public_channel,private_channel',
+                        exclude_archived=True,
+                        limit=1000,
+                        cursor=cursor
+                    )
+                    for channel in response['channels']:
+                        channel_ids[channel['name']] = channel['id']
+                    cursor = response.get('response_metadata', {}).get('next_cursor')
+                    if not cursor:
+                        break
+                
+                self._channel_id_cache = channel_ids
+                self._channel_id_cache_time = current_time
+        except Exception as e:
+            # Keep the old map (or '#name' fallback) and don't retry until the next refresh
+            self._channel_id_cache_time = current_time
+            print(f"❌ Error resolving channel IDs: {e}")
+        
+        return self._channel_id_cache.get(channel_name, f"#{channel_name}")
+    
     def update_message(self, channel_id: str, message_ts: str, new_text: str):
         """Update an existing message."""
         try:
@@ -586,7 +740,7 @@ class DailyStandupBot:
         """Send completion message to an accessible channel."""
         try:
             # Try escalation channel first
-            escalation_channel = f"#{self.config.SLACK_ESCALATION_CHANNEL}" if self.config.SLACK_ESCALATION_CHANNEL else "#leads"
+            escalation_channel = self.get_channel_id(self.config.SLACK_ESCALATION_CHANNEL or "leads")
             
             self.client.chat_postMessage(
                 channel=escalation_channel,
@@ -4,21 +4,51 @@ Handles Coda API operations for storing and retrieving bot data.
 """
 
 import os
+import atexit
+import threading
+import time
 import requests
+from collections import deque
 from datetime import datetime
 from dotenv import load_dotenv
 from difflib import SequenceMatcher
 from .config import BotConfig
+from .utils import logger
 import json
 
+try:
+    import orjson  # Optional: faster encoding/decoding of Coda request and response bodies
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv('.env')
 
 class CodaService:
     """Service class for Coda API operations."""
     
+    # Queued standup rows are written every interval, or sooner once this many are waiting
+    STANDUP_FLUSH_INTERVAL = 0.5
+    STANDUP_FLUSH_SIZE = 100
+    # Rows from a failed batch are re-queued this many times, STANDUP_RETRY_DELAY seconds apart
+    STANDUP_FLUSH_RETRIES = 3
+    STANDUP_RETRY_DELAY = 5
+    
     def __init__(self):
         """Initialize Coda service with API token and table IDs."""
+        # One pooled session for every Coda call, so keep-alive connections are reused
+        self.session = requests.Session()
+        # table_id -> {column name: column id}; table schemas don't change while the bot runs
+        self._column_id_maps = {}
+        # Pending standup rows, written in batches by a background thread that is
+        # started on the first enqueue. Enqueueing only appends and sets the event,
+        # so it never waits on a Coda request
+        self._standup_buffer = deque()
+        self._standup_flush_lock = threading.Lock()
+        self._standup_flush_event = threading.Event()
+        self._standup_flush_start_lock = threading.Lock()
+        self._standup_flush_thread = None
+        atexit.register(self.flush_standup_responses, retry=False)
         self.api_token = os.environ.get("CODA_API_TOKEN")
         self.doc_id = os.environ.get("CODA_DOC_ID")
         self.health_check_table_id = BotConfig.HEALTH_CHECK_TABLE  # Single health check table
@@ -54,20 +84,15 @@ class CodaService:
         print(f"   Error Table ID: {self.error_table_id}")
         
         # Debug: Check if environment variables are loaded
-        print("🔍 DEBUG: Environment variable check:")
-        print(f"   Health_Check env var: {os.environ.get('Health_Check', 'NOT SET')}")
-        print(f"   KR_Table env var: {os.environ.get('KR_Table', 'NOT SET')}")
-        print(f"   Stand_Up env var: {os.environ.get('Stand_Up', 'NOT SET')}")
-        print(f"   Blocker env var: {os.environ.get('Blocker', 'NOT SET')}")
-        print(f"   After_Health_Check env var: {os.environ.get('After_Health_Check', 'NOT SET')}")
-        print(f"   SLACK_ESCALATION_CHANNEL: {os.environ.get('SLACK_ESCALATION_CHANNEL', 'NOT SET')}")
+        logger.debug(
+            "Environment variable check: Health_Check=%s KR_Table=%s Stand_Up=%s Blocker=%s After_Health_Check=%s SLACK_ESCALATION_CHANNEL=%s",
+            *(os.environ.get(name, 'NOT SET') for name in
+              ('Health_Check', 'KR_Table', 'Stand_Up', 'Blocker', 'After_Health_Check', 'SLACK_ESCALATION_CHANNEL'))
+        )
     
-    def _make_request(self, method, endpoint, data=None):
+    def _make_request(self, method, endpoint, data=None, params=None):
         """Make a request to the Coda API."""
-        print(f"🔍 DEBUG: _make_request called:")
-        print(f"   - method: {method}")
-        print(f"   - endpoint: {endpoint}")
-        print(f"   - data: {data}")
+        logger.debug("_make_request %s %s data=%s", method, endpoint, data)
         
         if not self.api_token:
             print("❌ No API token available")
@@ -79,34 +104,38 @@ class CodaService:
             "Content-Type": "application/json"
         }
         
-        print(f"🔍 DEBUG: Making request to: {url}")
+        logger.debug("Making request to: %s", url)
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers)
+                response = self.session.get(url, headers=headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=data)
+                if orjson:
+                    response = self.session.post(url, headers=headers, data=orjson.dumps(data))
+                else:
+                    response = self.session.post(url, headers=headers, json=data)
             elif method.upper() == "PUT":
-                response = requests.put(url, headers=headers, json=data)
+                if orjson:
+                    response = self.session.put(url, headers=headers, data=orjson.dumps(data))
+                else:
+                    response = self.session.put(url, headers=headers, json=data)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers)
+                response = self.session.delete(url, headers=headers)
             else:
                 print(f"❌ Unsupported HTTP method: {method}")
                 return None
             
-            print(f"🔍 DEBUG: Response status: {response.status_code}")
-            print(f"🔍 DEBUG: Response text: {response.text}")
+            logger.debug("Response status: %s", response.status_code)
+            logger.debug("Response text: %s", response.text)
                 
             if response.status_code in [200, 201, 202]:
-                return response.json()
+                return orjson.loads(response.content) if orjson else response.json()
             else:
                 print(f"❌ Coda API error: {response.status_code} - {response.text}")
                 return None
                 
-        except Exception as e:
-            print(f"❌ Error making Coda API request: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error making Coda API request")
             return None
     
     def add_response(self, user_id, response, timestamp=None, username=None):
@@ -144,15 +173,10 @@ class CodaService:
     
     def add_blocker(self, user_id, blocker_description, kr_name, urgency, notes=None, username=None, sprint_number=None):
         """Add a blocker to the blocker table."""
-        print(f"🔍 DEBUG: add_blocker called with:")
-        print(f"   - user_id: {user_id}")
-        print(f"   - blocker_description: {blocker_description}")
-        print(f"   - kr_name: {kr_name}")
-        print(f"   - urgency: {urgency}")
-        print(f"   - notes: {notes}")
-        print(f"   - username: {username}")
-        print(f"   - sprint_number: {sprint_number}")
-        print(f"   - blocker_table_id: {self.blocker_table_id}")
+        logger.debug(
+            "add_blocker user_id=%s blocker_description=%s kr_name=%s urgency=%s notes=%s username=%s sprint_number=%s blocker_table_id=%s",
+            user_id, blocker_description, kr_name, urgency, notes, username, sprint_number, self.blocker_table_id
+        )
         
         if not self.blocker_table_id:
             print("❌ Blocker table ID not configured")
@@ -177,7 +201,7 @@ class CodaService:
             col_map = self.get_column_id_map(self.blocker_table_id)
             if "Sprint" in col_map:
                 cells.append({"column": "Sprint", "value": str(sprint_number)})
-                print(f"🔍 DEBUG: Added Sprint column with value: {sprint_number}")
+                logger.debug("Added Sprint column with value: %s", sprint_number)
             else:
                 print(f"⚠️ Sprint column not found in blocker table - skipping sprint number")
             
@@ -187,14 +211,14 @@ class CodaService:
             }]
         }
         
-        print(f"🔍 DEBUG: Sending data to Coda: {data}")
+        logger.debug("Sending data to Coda: %s", data)
         
         endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows"
-        print(f"🔍 DEBUG: Endpoint: {endpoint}")
+        logger.debug("Endpoint: %s", endpoint)
         
         result = self._make_request("POST", endpoint, data)
         
-        print(f"🔍 DEBUG: Coda response: {result}")
+        logger.debug("Coda response: %s", result)
         
         if result:
             print(f"✅ Blocker stored in Coda: {result.get('id', 'unknown')}")
@@ -205,22 +229,24 @@ class CodaService:
 
     def get_column_id_map(self, table_id):
         """Fetch and return a mapping from display name to column ID for a table."""
+        if table_id in self._column_id_maps:
+            return self._column_id_maps[table_id]
+        
         endpoint = f"/docs/{self.doc_id}/tables/{table_id}/columns"
         result = self._make_request("GET", endpoint)
         if not result or not result.get("items"):
             print("❌ Could not fetch columns for mapping.")
             return {}
-        return {col["name"]: col["id"] for col in result["items"]}
+        column_map = {col["name"]: col["id"] for col in result["items"]}
+        self._column_id_maps[table_id] = column_map
+        return column_map
 
     def resolve_blocker(self, user_id, kr_name, blocker_description, resolved_by, resolution_notes=None, slack_client=None, user_name=None):
         """Update the Resolution column for a blocker in the main blocker table, using column ID mapping. Tries both user_id and user_name for matching."""
-        print(f"🔍 DEBUG: resolve_blocker called with:")
-        print(f"   - user_id: {user_id}")
-        print(f"   - user_name: {user_name}")
-        print(f"   - kr_name: {kr_name}")
-        print(f"   - blocker_description: {blocker_description}")
-        print(f"   - resolved_by: {resolved_by}")
-        print(f"   - resolution_notes: {resolution_notes}")
+        logger.debug(
+            "resolve_blocker user_id=%s user_name=%s kr_name=%s blocker_description=%s resolved_by=%s resolution_notes=%s",
+            user_id, user_name, kr_name, blocker_description, resolved_by, resolution_notes
+        )
         
         if not self.blocker_table_id:
             print("❌ Blocker table ID not configured")
@@ -251,9 +277,9 @@ class CodaService:
         if user_name and user_name != user_id:
             user_identifiers.append(user_name)
         
-        print(f"🔍 DEBUG: Looking for user identifiers: {user_identifiers}")
-        print(f"🔍 DEBUG: Looking for KR: '{kr_name}'")
-        print(f"🔍 DEBUG: Looking for description: '{blocker_description}'")
+        logger.debug("Looking for user identifiers: %s", user_identifiers)
+        logger.debug("Looking for KR: '%s'", kr_name)
+        logger.debug("Looking for description: '%s'", blocker_description)
         
         # First pass: exact matching
         for row in result.get("items", []):
@@ -265,7 +291,7 @@ class CodaService:
             row_description = cells.get(col_map["Blocker Description"], "")
             row_resolution = cells.get(col_map["Resolution"], "")
             
-            print(f"🔍 DEBUG: Checking row - User ID: '{row_user_id}', Name: '{row_user_name}', KR: '{row_kr}', Desc: '{row_description}', Resolution: '{row_resolution}'")
+            logger.debug("Checking row - User ID: '%s', Name: '%s', KR: '%s', Desc: '%s', Resolution: '%s'", row_user_id, row_user_name, row_kr, row_description, row_resolution)
             
             # Check if this row matches any identifier
             user_matches = any(
@@ -283,7 +309,7 @@ class CodaService:
         
         # Second pass: if no exact match, try partial matching for description
         if not row_id:
-            print("🔍 DEBUG: No exact match found, trying partial description matching...")
+            logger.debug("No exact match found, trying partial description matching...")
             for row in result.get("items", []):
                 cells = row.get("values", {})
                 row_user_id = cells.get(col_map.get("User ID", ""), "")
@@ -308,7 +334,7 @@ class CodaService:
                         (len(blocker_description) > 20 and len(row_description) > 20 and
                          blocker_description[:20] == row_description[:20])):
                         description_matches = True
-                        print(f"🔍 DEBUG: Partial description match - '{blocker_description}' vs '{row_description}'")
+                        logger.debug("Partial description match - '%s' vs '%s'", blocker_description, row_description)
                 
                 if (user_matches and row_kr == kr_name and description_matches and not row_resolution):
                     row_id = row.get('id')
@@ -317,7 +343,7 @@ class CodaService:
         
         # Third pass: fallback - find the most recent unresolved blocker for this user and KR
         if not row_id:
-            print("🔍 DEBUG: No partial match found, trying fallback...")
+            logger.debug("No partial match found, trying fallback...")
             for row in result.get("items", []):
                 cells = row.get("values", {})
                 row_user_id = cells.get(col_map.get("User ID", ""), "")
@@ -343,11 +369,11 @@ class CodaService:
                 ]
             }
         }
-        print(f"🔍 DEBUG: Sending update data to Coda: {update_data}")
+        logger.debug("Sending update data to Coda: %s", update_data)
         endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows/{row_id}"
-        print(f"🔍 DEBUG: Endpoint: {endpoint}")
+        logger.debug("Endpoint: %s", endpoint)
         result = self._make_request("PUT", endpoint, update_data)
-        print(f"🔍 DEBUG: Coda response: {result}")
+        logger.debug("Coda response: %s", result)
         if result:
             print(f"✅ Blocker marked as resolved in Coda: {row_id}")
             return True
@@ -387,7 +413,8 @@ class CodaService:
             return []
             
         endpoint = f"/docs/{self.doc_id}/tables/{self.health_check_table_id}/rows"
-        result = self._make_request("GET", endpoint)
+        # Let Coda filter to this user's rows instead of downloading the whole table
+        result = self._make_request("GET", endpoint, params={"query": f'Name:"{user_id}"'})
         
         if not result:
             return []
@@ -506,6 +533,118 @@ class CodaService:
             print("❌ Failed to store standup response in Coda")
             return False
     
+    def add_standup_responses(self, responses):
+        """Add several standup responses to the standup table in one request.
+        
+        Each item is a dict with user_id, response_text and optional timestamp,
+        username and is_late keys (same meaning as add_standup_response).
+        """
+        if not self.standup_table_id:
+            print("❌ Standup table ID not configured")
+            return False
+        
+        if not responses:
+            return True
+        
+        rows = []
+        for item in responses:
+            user_id = item['user_id']
+            cells = [
+                {"column": "User ID", "value": user_id},
+                {"column": "Name", "value": item.get('username') or user_id},
+                {"column": "Response", "value": item['response_text']},
+                {"column": "Timestamp", "value": item.get('timestamp') or datetime.now().isoformat()}
+            ]
+            if item.get('is_late'):
+                cells.append({"column": "Status", "value": "Late"})
+            rows.append({"cells": cells})
+        
+        endpoint = f"/docs/{self.doc_id}/tables/{self.standup_table_id}/rows"
+        result = self._make_request("POST", endpoint, {"rows": rows})
+        
+        if result:
+            print(f"✅ {len(rows)} standup responses stored in Coda")
+            return True
+        else:
+            print("❌ Failed to store standup responses in Coda")
+            return False
+    
+    def queue_standup_response(self, user_id, response_text, timestamp=None, username=None, is_late=False):
+        """Queue a standup response; queued rows are written with add_standup_responses.
+        
+        The background flusher writes the queue every STANDUP_FLUSH_INTERVAL
+        seconds, or as soon as STANDUP_FLUSH_SIZE rows are waiting, so a morning
+        burst of check-ins becomes a few Coda requests instead of one per user.
+        """
+        self._standup_buffer.append({
+            'user_id': user_id,
+            'response_text': response_text,
+            'username': username,
+            'is_late': is_late,
+            'timestamp': timestamp or datetime.now().isoformat(),
+            'attempts': 0
+        })
+        
+        # Only the first enqueue takes the start lock
+        if self._standup_flush_thread is None:
+            self._start_standup_flusher()
+        self._standup_flush_event.set()
+    
+    def _start_standup_flusher(self):
+        with self._standup_flush_start_lock:
+            if self._standup_flush_thread is None:
+                thread = threading.Thread(target=self._run_standup_flusher, daemon=True)
+                thread.start()
+                self._standup_flush_thread = thread
+    
+    def _run_standup_flusher(self):
+        """Background loop that writes queued standup responses."""
+        while True:
+            # Sleep until something is queued, then give the burst an interval to
+            # collect unless a full batch is already waiting
+            self._standup_flush_event.wait()
+            if len(self._standup_buffer) < self.STANDUP_FLUSH_SIZE:
+                time.sleep(self.STANDUP_FLUSH_INTERVAL)
+            self._standup_flush_event.clear()
+            if not self.flush_standup_responses():
+                time.sleep(self.STANDUP_RETRY_DELAY)
+    
+    def flush_standup_responses(self, retry=True):
+        """Write all queued standup responses to Coda in a single request.
+        
+        On failure the rows are re-queued (up to STANDUP_FLUSH_RETRIES times, and
+        only when retry is set); rows that are given up on are logged in full so
+        they can be re-entered by hand. Returns False if the write failed.
+        """
+        # Drain under the lock, then release it before the HTTP request
+        with self._standup_flush_lock:
+            batch = []
+            while self._standup_buffer:
+                batch.append(self._standup_buffer.popleft())
+        
+        if not batch:
+            return True
+        
+        try:
+            if self.add_standup_responses(batch):
+                return True
+            print(f"❌ Failed to store {len(batch)} queued standup responses in Coda")
+        except Exception as e:
+            print(f"❌ Error storing queued standup responses in Coda: {e}")
+        
+        dropped = []
+        for item in batch:
+            item['attempts'] += 1
+            if retry and item['attempts'] <= self.STANDUP_FLUSH_RETRIES:
+                self._standup_buffer.append(item)
+            else:
+                dropped.append(item)
+        if len(dropped) < len(batch):
+            self._standup_flush_event.set()
+        if dropped:
+            logger.error(f"Dropped {len(dropped)} standup responses after failed Coda writes: {json.dumps(dropped)}")
+        return False
+    
     def search_kr_table(self, search_term, sprint_number=None):
         """Search all 16 KR tables for a KR/assignment name with improved fuzzy matching and sprint filtering.
         Prioritizes the 6 recommended KR tables first, then falls back to others if nothing found."""
@@ -519,7 +658,7 @@ class CodaService:
         original_search_term = search_term
         if search_term.startswith('* '):
             search_term = search_term[2:]  # Remove "* " prefix
-            print(f"🔍 DEBUG: search_kr_table - Stripped asterisk prefix, now searching for: '{search_term}'")
+            logger.debug("search_kr_table - Stripped asterisk prefix, now searching for: '%s'", search_term)
 
         # Parse search term for sprint number and KR name
         search_parts = search_term.split()
@@ -530,12 +669,12 @@ class CodaService:
             if part.lower().startswith('sprint') and len(part) > 6:
                 try:
                     detected_sprint = int(part[6:])  # Extract number after "sprint"
-                    print(f"🔍 DEBUG: Found sprint number in search term: {detected_sprint}")
+                    logger.debug("Found sprint number in search term: %s", detected_sprint)
                 except ValueError:
                     kr_search_terms.append(part)
             elif part.isdigit() and 1 <= int(part) <= 20:  # Assume it's a sprint number
                 detected_sprint = int(part)
-                print(f"🔍 DEBUG: Found sprint number in search term: {detected_sprint}")
+                logger.debug("Found sprint number in search term: %s", detected_sprint)
             else:
                 kr_search_terms.append(part)
         
@@ -544,7 +683,7 @@ class CodaService:
         
         # Reconstruct KR search term without sprint info
         kr_search_term = ' '.join(kr_search_terms) if kr_search_terms else search_term
-        print(f"🔍 DEBUG: KR search term: '{kr_search_term}', Sprint: {final_sprint}")
+        logger.debug("KR search term: '%s', Sprint: %s", kr_search_term, final_sprint)
 
         # Table IDs for all 16 KR tables - prioritize the 6 recommended tables first
         priority_table_ids = []
@@ -572,16 +711,16 @@ class CodaService:
             if table_id:
                 if env_var in priority_tables:
                     priority_table_ids.append((env_var, table_id))
-                    print(f"🔍 DEBUG: Added priority table {env_var}: {table_id}")
+                    logger.debug("Added priority table %s: %s", env_var, table_id)
                 else:
                     fallback_table_ids.append((env_var, table_id))
-                    print(f"🔍 DEBUG: Added fallback table {env_var}: {table_id}")
+                    logger.debug("Added fallback table %s: %s", env_var, table_id)
             else:
-                print(f"🔍 DEBUG: KR table {env_var} not found in environment variables")
+                logger.debug("KR table %s not found in environment variables", env_var)
         
         # Search priority tables first, then fallback tables
         prioritized_table_ids = priority_table_ids + fallback_table_ids
-        print(f"🔍 DEBUG: Search order - Priority tables first: {[name for name, _ in priority_table_ids]}")
+        logger.debug("Search order - Priority tables first: %s", [name for name, _ in priority_table_ids])
         
         doc_id = self.doc_id
         all_matches = []
@@ -615,22 +754,22 @@ class CodaService:
                 col_name = col.get("name", "").lower()
                 if any(keyword in col_name for keyword in ["key result", "kr", "name", "title", "description"]):
                     kr_name_column = col.get("id")
-                    print(f"🔍 DEBUG: Found KR name column '{col.get('name')}' with ID '{kr_name_column}' in table {table_id}")
+                    logger.debug("Found KR name column '%s' with ID '%s' in table %s", col.get('name'), kr_name_column, table_id)
                 elif any(keyword in col_name for keyword in ["sprint", "iteration", "cycle"]):
                     sprint_column = col.get("id")
-                    print(f"🔍 DEBUG: Found sprint column '{col.get('name')}' with ID '{sprint_column}' in table {table_id}")
+                    logger.debug("Found sprint column '%s' with ID '%s' in table %s", col.get('name'), sprint_column, table_id)
             
             # If no specific column found, use the display column (usually the main name column)
             if not kr_name_column:
                 display_column = schema_result.get("displayColumn", {})
                 if display_column:
                     kr_name_column = display_column.get("id")
-                    print(f"🔍 DEBUG: Using display column '{display_column.get('name', 'Unknown')}' with ID '{kr_name_column}' in table {table_id}")
+                    logger.debug("Using display column '%s' with ID '%s' in table %s", display_column.get('name', 'Unknown'), kr_name_column, table_id)
             
             # If still no column found, use the first column
             if not kr_name_column and columns:
                 kr_name_column = columns[0].get("id")
-                print(f"🔍 DEBUG: Using first column '{columns[0].get('name')}' with ID '{kr_name_column}' in table {table_id}")
+                logger.debug("Using first column '%s' with ID '%s' in table %s", columns[0].get('name'), kr_name_column, table_id)
             
             if not kr_name_column:
                 print(f"❌ Could not find KR name column in table {table_id}")
@@ -660,7 +799,7 @@ class CodaService:
                             if sprint_number_str not in row_sprint_str and row_sprint_str not in sprint_number_str:
                                 continue
                             else:
-                                print(f"🔍 DEBUG: Sprint match found: '{row_sprint_str}' matches '{sprint_number_str}'")
+                                logger.debug("Sprint match found: '%s' matches '%s'", row_sprint_str, sprint_number_str)
                     except Exception as sprint_error:
                         print(f"⚠️ Sprint comparison error: {sprint_error}")
                         pass  # Continue if sprint comparison fails
@@ -674,26 +813,26 @@ class CodaService:
                         **cells  # Include all the cell values
                     }
                     matches.append(match_data)
-                    print(f"🔍 DEBUG: Found match in table {table_id}: '{kr_name}' (row ID: {row.get('id')})")
+                    logger.debug("Found match in table %s: '%s' (row ID: %s)", table_id, kr_name, row.get('id'))
             
             return matches
 
         # Search tables in priority order (6 recommended tables first)
         for table_name, table_id in prioritized_table_ids:
-            print(f"🔍 DEBUG: Searching table {table_name} ({table_id})")
+            logger.debug("Searching table %s (%s)", table_name, table_id)
             table_matches = search_table(table_id)
             all_matches.extend(table_matches)
             
             # If we found matches in priority tables, we can stop early
             if table_name in [name for name, _ in priority_table_ids] and table_matches:
-                print(f"🔍 DEBUG: Found {len(table_matches)} matches in priority table {table_name}, continuing search for more results")
+                logger.debug("Found %s matches in priority table %s, continuing search for more results", len(table_matches), table_name)
             
             # Limit results to prevent overwhelming output
             if len(all_matches) >= 10:
-                print(f"🔍 DEBUG: Reached result limit of 10, stopping search")
+                logger.debug("Reached result limit of 10, stopping search")
                 break
 
-        print(f"🔍 DEBUG: search_kr_table found {len(all_matches)} total matches for '{kr_search_term}' in sprint {final_sprint}")
+        logger.debug("search_kr_table found %s total matches for '%s' in sprint %s", len(all_matches), kr_search_term, final_sprint)
         
         # Sort results by relevance (priority table matches first, then by similarity)
         if all_matches:
@@ -728,7 +867,7 @@ class CodaService:
                 return 0.0
             
             all_matches.sort(key=sort_key, reverse=True)
-            print(f"🔍 DEBUG: Results sorted by relevance (priority tables first)")
+            logger.debug("Results sorted by relevance (priority tables first)")
         
         return all_matches
 
@@ -770,13 +909,13 @@ class CodaService:
     
     def find_kr_row(self, kr_name):
         """Find a specific KR row in the KR table by name using fuzzy matching."""
-        print(f"🔍 DEBUG: find_kr_row called with kr_name: '{kr_name}'")
+        logger.debug("find_kr_row called with kr_name: '%s'", kr_name)
         
         # Strip asterisk prefix if present
         original_kr_name = kr_name
         if kr_name.startswith('* '):
             kr_name = kr_name[2:]  # Remove "* " prefix
-            print(f"🔍 DEBUG: Stripped asterisk prefix, now searching for: '{kr_name}'")
+            logger.debug("Stripped asterisk prefix, now searching for: '%s'", kr_name)
         
         kr_table_id = os.environ.get("KR_Table")
         if not kr_table_id:
@@ -790,7 +929,7 @@ class CodaService:
             print("❌ No result from Coda API")
             return None
         
-        print(f"🔍 DEBUG: Found {len(result.get('items', []))} rows in KR table")
+        logger.debug("Found %s rows in KR table", len(result.get('items', [])))
         
         # Search for the KR by name with fuzzy matching
         best_match = None
@@ -802,11 +941,11 @@ class CodaService:
             current_kr_name = cells.get("c-yQ1M6UqTSj", "")  # Coda column ID for 'Key Result'
             current_name_lower = current_kr_name.lower().strip()
             
-            print(f"🔍 DEBUG: Checking row with KR name: '{current_kr_name}' against search: '{kr_name}'")
+            logger.debug("Checking row with KR name: '%s' against search: '%s'", current_kr_name, kr_name)
             
             # Exact match (highest priority)
             if kr_name.lower() == current_kr_name.lower():
-                print(f"🔍 DEBUG: Exact match found!")
+                logger.debug("Exact match found!")
                 return row
             
             # Fuzzy match using similarity calculation
@@ -817,14 +956,14 @@ class CodaService:
                 if similarity > best_ratio:
                     best_ratio = similarity
                     best_match = row
-                    print(f"🔍 DEBUG: New best match found with {similarity:.2%} similarity")
+                    logger.debug("New best match found with %.2f%% similarity", similarity * 100)
         
         # Return best match if it meets the 100% threshold (perfect match)
         if best_match and best_ratio >= 1.0:
-            print(f"🔍 DEBUG: Perfect match found with {best_ratio:.2%} similarity!")
+            logger.debug("Perfect match found with %.2f%% similarity!", best_ratio * 100)
             return best_match
         
-        print(f"🔍 DEBUG: No matches found for '{kr_name}' (best match was {best_ratio:.2%})")
+        logger.debug("No matches found for '%s' (best match was %.2f%%)", kr_name, best_ratio * 100)
         return None
     
     def _calculate_similarity(self, str1, str2):
@@ -946,9 +1085,9 @@ class CodaService:
         result = self._make_request("GET", endpoint)
         
         if result:
-            print("🔍 DEBUG: KR Table Structure:")
+            logger.debug("KR Table Structure:")
             # The response structure is different - let's check what we actually get
-            print(f"🔍 DEBUG: Full table response: {result}")
+            logger.debug("Full table response: %s", result)
             
             # Try to get columns from the response
             if isinstance(result, dict):
@@ -956,13 +1095,13 @@ class CodaService:
                 if "displayColumn" in result:
                     display_col = result["displayColumn"]
                     if isinstance(display_col, dict):
-                        print(f"   Display Column: {display_col.get('name', 'Unknown')} - ID: {display_col.get('id', 'Unknown')}")
+                        logger.debug("Display Column: %s - ID: %s", display_col.get('name', 'Unknown'), display_col.get('id', 'Unknown'))
                     elif isinstance(display_col, list):
                         for column in display_col:
                             if isinstance(column, dict):
-                                print(f"   Column: {column.get('name', 'Unknown')} - ID: {column.get('id', 'Unknown')}")
+                                logger.debug("Column: %s - ID: %s", column.get('name', 'Unknown'), column.get('id', 'Unknown'))
                 else:
-                    print("   No displayColumn found in response")
+                    logger.debug("No displayColumn found in response")
             return result
         else:
             print("❌ Failed to get KR table structure")
@@ -975,7 +1114,7 @@ class CodaService:
             if user_info.get("ok"):
                 return user_info["user"].get("real_name", "")
         except Exception as e:
-            print(f"🔍 DEBUG: Error getting display name for {user_id}: {e}")
+            logger.debug("Error getting display name for %s: %s", user_id, e)
         return "" 
 
     def get_user_blockers(self, user_id):
@@ -990,8 +1129,15 @@ class CodaService:
             print("❌ Could not get column mapping for blocker table")
             return []
         
+        # Get user ID from the correct column
+        user_id_col = column_map.get("User ID") or column_map.get("Name")
+        if not user_id_col:
+            print("❌ Could not find User ID or Name column in blocker table")
+            return []
+        
         endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows"
-        result = self._make_request("GET", endpoint)
+        # Let Coda filter to this user's rows instead of downloading the whole table
+        result = self._make_request("GET", endpoint, params={"query": f'{user_id_col}:"{user_id}"'})
         if not result:
             return []
         
@@ -999,12 +1145,6 @@ class CodaService:
         for row in result.get("items", []):
             cells = row.get("values", {})
             
-            # Get user ID from the correct column
-            user_id_col = column_map.get("User ID") or column_map.get("Name")
-            if not user_id_col:
-                print("❌ Could not find User ID or Name column in blocker table")
-                continue
-                
             # Check if this row belongs to the user
             if cells.get(user_id_col, "") == user_id:
                 # Check if this blocker is resolved (has resolution notes)
@@ -1050,7 +1190,7 @@ class CodaService:
                         "row_id": row.get("id", "")
                     })
         
-        print(f"🔍 DEBUG: Found {len(blockers)} active blockers for user {user_id}")
+        logger.debug("Found %s active blockers for user %s", len(blockers), user_id)
         return blockers
 
     def get_user_blockers_by_sprint(self, user_id, sprint_number=None):
@@ -1065,8 +1205,15 @@ class CodaService:
             print("❌ Could not get column mapping for blocker table")
             return []
         
+        # Get user ID from the correct column
+        user_id_col = column_map.get("User ID") or column_map.get("Name")
+        if not user_id_col:
+            print("❌ Could not find User ID or Name column in blocker table")
+            return []
+        
         endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows"
-        result = self._make_request("GET", endpoint)
+        # Let Coda filter to this user's rows instead of downloading the whole table
+        result = self._make_request("GET", endpoint, params={"query": f'{user_id_col}:"{user_id}"'})
         if not result:
             return []
         
@@ -1074,12 +1221,6 @@ class CodaService:
         for row in result.get("items", []):
             cells = row.get("values", {})
             
-            # Get user ID from the correct column
-            user_id_col = column_map.get("User ID") or column_map.get("Name")
-            if not user_id_col:
-                print("❌ Could not find User ID or Name column in blocker table")
-                continue
-                
             # Check if this row belongs to the user
             if cells.get(user_id_col, "") == user_id:
                 # Check if this blocker is resolved (has resolution notes)
@@ -1135,7 +1276,7 @@ class CodaService:
                         "sprint_number": sprint_number
                     })
         
-        print(f"🔍 DEBUG: Found {len(blockers)} active blockers for user {user_id}" + (f" in Sprint {sprint_number}" if sprint_number else ""))
+        logger.debug("Found %s active blockers for user %s%s", len(blockers), user_id, f" in Sprint {sprint_number}" if sprint_number else "")
         return blockers 
 
     def update_blocker_note(self, row_id, new_note):
@@ -1168,7 +1309,7 @@ class CodaService:
             print("❌ Could not get column mapping for blocker table")
             return False
         
-        print(f"🔍 DEBUG: Available columns in blocker table: {list(col_map.keys())}")
+        logger.debug("Available columns in blocker table: %s", list(col_map.keys()))
         
         # Prepare cells to update
         cells = []
@@ -1180,7 +1321,7 @@ class CodaService:
             for col_name in ["Resolution", "Resolution Notes", "Status", "Notes"]:
                 if col_name in col_map:
                     resolution_col = col_map[col_name]
-                    print(f"🔍 DEBUG: Using column '{col_name}' for resolution notes")
+                    logger.debug("Using column '%s' for resolution notes", col_name)
                     break
             
             if resolution_col:
@@ -1193,7 +1334,7 @@ class CodaService:
         for col_name in ["Resolution Timestamp", "Resolved Date", "Completion Date", "Timestamp"]:
             if col_name in col_map:
                 timestamp_col = col_map[col_name]
-                print(f"🔍 DEBUG: Using column '{col_name}' for resolution timestamp")
+                logger.debug("Using column '%s' for resolution timestamp", col_name)
                 break
         
         if timestamp_col:
@@ -1205,7 +1346,7 @@ class CodaService:
             print("⚠️ No resolution notes provided and no timestamp column found - nothing to update")
             return True
         
-        print(f"🔍 DEBUG: Updating blocker row {row_id} with cells: {cells}")
+        logger.debug("Updating blocker row %s with cells: %s", row_id, cells)
         
         endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows/{row_id}"
         data = {
@@ -1369,12 +1510,6 @@ class CodaService:
             # Update status
             if is_blocked:
                 status_value = "Blocked"
-                # Add blocker context and reporter info
-                blocker_info = f"Blocked at {timestamp}"
-                if reported_by:
-                    blocker_info += f" by {reported_by}"
-                if blocker_context:
-                    blocker_info += f" - Context: {blocker_context}"
                 
                 # Use column IDs instead of column names
                 cells_to_update = []
@@ -1643,7 +1778,7 @@ class CodaService:
                 print("❌ Could not get column mapping for blocker table")
                 return []
             
-            print(f"🔍 DEBUG: Available columns in blocker table: {list(col_map.keys())}")
+            logger.debug("Available columns in blocker table: %s", list(col_map.keys()))
             
             # Get all rows from the blocker table
             endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows"
@@ -1663,7 +1798,7 @@ class CodaService:
                     col_id = col_map["Resolution"]
                     resolution_notes = values.get(col_id, "")
                     if resolution_notes:
-                        print(f"🔍 DEBUG: Found resolution notes in column 'Resolution': {resolution_notes}")
+                        logger.debug("Found resolution notes in column 'Resolution': %s", resolution_notes)
                 
                 # Check resolution timestamp if available
                 resolution_timestamp = ""
@@ -1672,7 +1807,7 @@ class CodaService:
                         col_id = col_map[col_name]
                         resolution_timestamp = values.get(col_id, "")
                         if resolution_timestamp:
-                            print(f"🔍 DEBUG: Found resolution timestamp in column '{col_name}': {resolution_timestamp}")
+                            logger.debug("Found resolution timestamp in column '%s': %s", col_name, resolution_timestamp)
                             break
                 
                 # Consider unresolved if no resolution notes and no resolution timestamp
@@ -1703,7 +1838,7 @@ class CodaService:
                     # Only add if we have the essential data
                     if blocker_data['user_id'] and blocker_data['kr_name']:
                         unresolved_blockers.append(blocker_data)
-                        print(f"🔍 DEBUG: Found unresolved blocker: {blocker_data['name']} - {blocker_data['kr_name']}")
+                        logger.debug("Found unresolved blocker: %s - %s", blocker_data['name'], blocker_data['kr_name'])
                     else:
                         print(f"⚠️ Skipping blocker with missing data: user_id={blocker_data['user_id']}, kr_name={blocker_data['kr_name']}")
             
@@ -1727,7 +1862,7 @@ class CodaService:
                 print("❌ Could not get column mapping for blocker table")
                 return []
             
-            print(f"🔍 DEBUG: Available columns in blocker table: {list(col_map.keys())}")
+            logger.debug("Available columns in blocker table: %s", list(col_map.keys()))
             
             # Get all rows from the blocker table
             endpoint = f"/docs/{self.doc_id}/tables/{self.blocker_table_id}/rows"
@@ -1758,7 +1893,7 @@ class CodaService:
                         'status': values.get(col_map.get("Status", ""), "")
                     }
                     matching_blockers.append(blocker_data)
-                    print(f"🔍 DEBUG: Found matching blocker: {blocker_data['name']} - {blocker_data['kr_name']}")
+                    logger.debug("Found matching blocker: %s - %s", blocker_data['name'], blocker_data['kr_name'])
             
             print(f"✅ Found {len(matching_blockers)} matching blockers for KR '{kr_name}' in Coda")
             return matching_blockers
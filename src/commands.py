@@ -7,8 +7,7 @@ from .utils import logger, error_handler, input_validator, safe_executor
 
 def _process_command(bot, user_id, command, text="", channel_id=None):
     """Process slash commands."""
-    user_name = bot.get_user_name(user_id)
-    print(f"Processing command '{command}' from user {user_name} ({user_id})")
+    print(f"Processing command '{command}' from user {user_id}")
     
     if command == 'help':
         return _handle_help_command(bot, user_id, channel_id)
@@ -39,8 +38,6 @@ def _process_command(bot, user_id, command, text="", channel_id=None):
 def _handle_help_command(bot, user_id, channel_id):
     """Handle /help command."""
     try:
-        user_name = bot.get_user_name(user_id)
-        
         # Create properly formatted help blocks
         help_blocks = [
         {
@@ -122,17 +119,11 @@ def _handle_kr_command(bot, user_id, text, channel_id):
         def process_kr_command():
             try:
                 time.sleep(1.0)
-                try:
-                    user_info = bot.client.users_info(user=user_id)
-                    user_name = user_info['user']['real_name']
-                except Exception as e:
-                    print(f"❌ Error getting user info: {e}")
-                    user_name = f"User {user_id}"
                 
                 # Check if user has pending KR data to continue
                 if hasattr(bot, 'pending_kr_search') and user_id in bot.pending_kr_search:
                     pending_data = bot.pending_kr_search[user_id]
-                    bot.send_kr_continue_form(user_id, user_name, pending_data)
+                    bot.send_kr_continue_form(user_id, bot.get_user_name(user_id), pending_data)
                 else:
                     # Parse command text for sprint number and KR name
                     parts = text.split() if text else []
@@ -157,10 +148,11 @@ def _handle_kr_command(bot, user_id, text, channel_id):
                         return
                     
                     # Always trigger mentor check, pass search_term and sprint_number if present
+                    # (user_name is resolved inside send_mentor_check only when rendered)
                     bot.send_mentor_check(
                         user_id=user_id,
                         standup_ts=None,  # No thread for slash commands
-                        user_name=user_name,
+                        user_name=None,
                         request_type="kr",
                         channel=user_id,
                         search_term=search_term,
@@ -211,28 +203,20 @@ def _handle_blocked_command(bot, user_id, channel_id):
                 # Add a small delay to avoid rate limiting
                 time.sleep(1.0)  # Increased delay for free workspace
                 
-                # Get user info with error handling
-                try:
-                    user_info = bot.client.users_info(user=user_id)
-                    user_name = user_info['user']['real_name']
-                except Exception as e:
-                    print(f"❌ Error getting user info: {e}")
-                    user_name = f"User {user_id}"
-                
-                # Send mentor check for blocker reporting
+                # Send mentor check for blocker reporting (user_name resolved lazily)
                 try:
                     result = bot.send_mentor_check(
                         user_id=user_id,
                         standup_ts=None,
-                        user_name=user_name,
+                        user_name=None,
                         request_type="blocker",
                         channel=user_id
                     )
                     
                     if result:
-                        print(f"✅ Mentor check sent successfully for blocker reporting to {user_name}")
+                        print(f"✅ Mentor check sent successfully for blocker reporting to {user_id}")
                     else:
-                        print(f"❌ Failed to send mentor check for blocker reporting to {user_name}")
+                        print(f"❌ Failed to send mentor check for blocker reporting to {user_id}")
                         
                 except Exception as e:
                     print(f"❌ Error sending mentor check for blocker reporting: {e}")
@@ -380,8 +364,7 @@ def _handle_blocker_command(bot, user_id, channel_id):
                 
                 # Get user info with error handling
                 try:
-                    user_info = bot.client.users_info(user=user_id)
-                    user_name = user_info['user']['real_name']
+                    user_name = bot.get_user(user_id)['real_name']
                 except Exception as e:
                     print(f"❌ Error getting user info: {e}")
                     user_name = f"User {user_id}"
@@ -458,8 +441,7 @@ def _handle_autorole_command(bot, user_id, text, channel_id):
                 
                 # Get user info with error handling
                 try:
-                    user_info = bot.client.users_info(user=user_id)
-                    user_name = user_info['user']['real_name']
+                    user_name = bot.get_user(user_id)['real_name']
                 except Exception as e:
                     print(f"❌ Error getting user info: {e}")
                     user_name = f"User {user_id}"
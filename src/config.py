@@ -4,6 +4,7 @@ Modify these settings to customize the bot behavior.
 """
 
 import os
+import re
 from dotenv import load_dotenv
 
 # Load environment variables from .env
@@ -14,7 +15,7 @@ class BotConfig:
     
     # Slack Configuration
     SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
-    SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")
+    SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")  # HTTP Events API only; Socket Mode envelopes arrive unsigned over the app-token websocket
     SLACK_CHANNEL_ID = os.environ.get("SLACK_CHANNEL_ID")  # Fallback channel for general bot messages
     SLACK_ESCALATION_CHANNEL = os.environ.get("SLACK_ESCALATION_CHANNEL", "leads")
     SLACK_BOT_USER_ID = os.environ.get("SLACK_BOT_USER_ID", "U0912DJRNSF")  # Bot user ID
@@ -30,7 +31,8 @@ class BotConfig:
     MONITOR_EMOJI = os.environ.get("MONITOR_EMOJI", "🕓")
     AUTO_ESCALATION_DELAY_HOURS = int(os.environ.get("AUTO_ESCALATION_DELAY_HOURS", "2"))
     
-    # Flask Configuration
+    # Flask Configuration (legacy; unused since the bot runs in Socket Mode with no
+    # HTTP server - request concurrency is set by SOCKET_MODE_CONCURRENCY instead)
     FLASK_HOST = os.environ.get("FLASK_HOST", "0.0.0.0")
     FLASK_PORT = int(os.environ.get("FLASK_PORT", "3000"))
     FLASK_DEBUG = os.environ.get("FLASK_DEBUG", "False") == "True"
@@ -48,6 +50,9 @@ class BotConfig:
     RESPONSE_TABLE = os.environ.get("Response")
     ERROR_TABLE = os.environ.get("ERROR_TABLE", "error_logs")  # Fallback if not set
     
+    # Dedup Configuration (optional; in-memory dedup is used when unset)
+    REDIS_URL = os.environ.get("REDIS_URL")
+    
     # AI Configuration
     MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
     
@@ -97,15 +102,18 @@ React with one of the following:
 <!here> please reach out to <@{user_id}> to provide assistance.
 """.strip()
     
-    # Response parsing patterns
+    # Response parsing patterns, compiled once at import (case-insensitive).
+    # Each is anchored to the start of a line and only uses same-line, bounded
+    # repeats ([^\S\n] is "whitespace except newline"), so a long pasted log
+    # can't make them backtrack across the whole message.
     RESPONSE_PATTERNS = {
-        'on_track': r'on\s*track\s*:\s*(yes|no)',
-        'blockers': r'blockers?\s*:\s*(none|no|.*?)(?:\n|$)',
-        'today_work': r'today\s*:\s*(.*?)(?:\n|$)',
+        'on_track': re.compile(r'^[^\S\n]*on[ _]?track[^\S\n]*[:\-][^\S\n]*(yes|no|y|n)\b', re.IGNORECASE | re.MULTILINE),
+        'blockers': re.compile(r'^[^\S\n]*blockers?[^\S\n]*[:\-][^\S\n]*([^\n]{0,500})', re.IGNORECASE | re.MULTILINE),
+        'today_work': re.compile(r'^[^\S\n]*today[^\S\n]*[:\-][^\S\n]*([^\n]{0,500})', re.IGNORECASE | re.MULTILINE),
     }
     
-    # Valid "no blockers" responses
-    NO_BLOCKERS_KEYWORDS = ['none', 'no', 'n/a', '']
+    # Valid "no blockers" responses (lowercase; match against the captured value only)
+    NO_BLOCKERS_KEYWORDS = frozenset({'none', 'no', 'n/a', ''})
     
     @classmethod
     def validate_config(cls):
@@ -132,6 +140,7 @@ React with one of the following:
             'escalation_channel': cls.SLACK_ESCALATION_CHANNEL,
             'mongodb_uri': os.environ.get("MONGODB_URI"),
             'mongodb_db_name': os.environ.get("MONGODB_DB_NAME"),
+            'redis_url': cls.REDIS_URL,
             'standup_time': cls.STANDUP_TIME,
             'reminder_time': cls.REMINDER_TIME,
             'response_deadline': cls.RESPONSE_DEADLINE,
@@ -1,16 +1,32 @@
 import json
 import time
 import threading
+from collections import OrderedDict
 from datetime import datetime
 # Flask imports removed for Socket Mode compatibility
 from .utils import logger, error_handler, input_validator, safe_executor
 
-# Global submission tracking to prevent duplicates
-_submission_tracker = {}
+# Global submission tracking to prevent duplicates (key -> time, oldest first)
+_submission_tracker = OrderedDict()
+_submission_tracker_lock = threading.Lock()
+
+# Message subtypes the bot never acts on (edits, deletes, joins, bot posts)
+_IGNORED_SUBTYPES = frozenset({
+    'bot_message',
+    'message_changed',
+    'message_deleted',
+    'channel_join',
+    'channel_leave',
+})
+
+# Reactions _handle_reaction_event acts on: standup quick status, followup help/monitor
+_HANDLED_REACTIONS = frozenset({'white_check_mark', 'warning', 'rotating_light', 'sos', 'clock4'})
+
+# Words in a channel message that trigger the "report a blocker?" prompt
+_BLOCKER_KEYWORDS = ('blocker', 'blocked', 'stuck')
 
 def track_submission(user_id, submission_type, data_hash=None):
     """Track a submission to prevent duplicates."""
-    global _submission_tracker
     current_time = time.time()
     
     # Create a unique key for this submission
@@ -19,38 +35,32 @@ def track_submission(user_id, submission_type, data_hash=None):
     else:
         submission_key = f"{user_id}_{submission_type}_{int(current_time)}"
     
-    # Clean up old submissions (older than 30 seconds)
-    _submission_tracker = {k: v for k, v in _submission_tracker.items() if current_time - v < 30}
-    
-    # Check if this is a recent duplicate
-    if submission_key in _submission_tracker:
-        print(f"🔍 DEBUG: Duplicate submission detected: {submission_key}")
-        return False
+    with _submission_tracker_lock:
+        # Clean up old submissions (older than 30 seconds); entries are in time
+        # order, so only the expired ones at the front are touched
+        while _submission_tracker:
+            oldest_key = next(iter(_submission_tracker))
+            if current_time - _submission_tracker[oldest_key] < 30:
+                break
+            _submission_tracker.popitem(last=False)
+        
+        # Check if this is a recent duplicate
+        if submission_key in _submission_tracker:
+            logger.debug("Duplicate submission detected: %s", submission_key)
+            return False
+        
+        # Track this submission
+        _submission_tracker[submission_key] = current_time
     
-    # Track this submission
-    _submission_tracker[submission_key] = current_time
-    print(f"🔍 DEBUG: Tracking submission: {submission_key}")
+    logger.debug("Tracking submission: %s", submission_key)
     return True
 
 def log_payload_for_debugging(payload):
-    """Log payload structure for debugging."""
+    """Log payload structure for debugging (formatted only when DEBUG is enabled)."""
     try:
-        print("🔍 DEBUG: Received payload:")
-        print(f"   Type: {payload.get('type', 'N/A')}")
-        print(f"   Keys: {list(payload.keys())}")
-        
-        if 'user' in payload:
-            print(f"   User: {payload['user']}")
-        
-        if 'actions' in payload:
-            print(f"   Actions: {payload['actions']}")
-        
-        if 'channel' in payload:
-            print(f"   Channel: {payload['channel']}")
-        
-        if 'message' in payload:
-            print(f"   Message keys: {list(payload['message'].keys())}")
-            
+        logger.debug("Received payload: type=%s keys=%s user=%s actions=%s channel=%s",
+                     payload.get('type', 'N/A'), list(payload.keys()), payload.get('user'),
+                     payload.get('actions'), payload.get('channel'))
     except Exception as e:
         print(f"❌ Error logging payload: {e}")
 
@@ -75,12 +85,12 @@ def generate_kr_explanation(kr_name, owner, status, definition_of_done=None):
 def handle_blocker_note_edit(bot, payload):
     """Handle blocker note edit button click."""
     try:
-        print(f"🔍 DEBUG: handle_blocker_note_edit called with payload: {payload}")
+        logger.debug("handle_blocker_note_edit called with payload: %s", payload)
         user_id = payload['user']['id']
         user_name = bot.get_user_name(user_id)
         blocker_id = payload['actions'][0]['value']
         
-        print(f"🔍 DEBUG: Processing blocker note edit - User: {user_name}, Blocker ID: {blocker_id}")
+        logger.debug("Processing blocker note edit - User: %s, Blocker ID: %s", user_name, blocker_id)
         
         # Check if trigger_id exists (button clicks don't have trigger_id)
         trigger_id = payload.get('trigger_id')
@@ -110,7 +120,7 @@ def handle_blocker_note_edit(bot, payload):
             bot.tracked_blockers = {}
         bot.tracked_blockers[user_id] = blocker_id
         
-        print(f"🔍 DEBUG: Stored blocker_id {blocker_id} for user {user_id}")
+        logger.debug("Stored blocker_id %s for user %s", blocker_id, user_id)
         
         # Open modal
         modal_result = bot.open_modal(
@@ -127,10 +137,8 @@ def handle_blocker_note_edit(bot, payload):
             print(f"❌ DEBUG: Failed to open modal for blocker note edit")
         
         return {"response_action": "clear"}
-    except Exception as e:
-        print(f"❌ Error handling blocker note edit: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error handling blocker note edit")
         return {"response_action": "clear"}
 
 
@@ -138,12 +146,10 @@ def handle_blocker_note_edit(bot, payload):
 def handle_complete_blocker_with_form(bot, payload):
     """Handle blocker completion with form modal."""
     try:
-        user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         blocker_id = payload['actions'][0]['value']
         trigger_id = payload['trigger_id']
         
-        print(f"🔍 DEBUG: Opening completion form for blocker: {blocker_id}")
+        logger.debug("Opening completion form for blocker: %s", blocker_id)
         
         # Create completion form modal
         blocks = [
@@ -177,7 +183,7 @@ def handle_complete_blocker_with_form(bot, payload):
 def handle_mentor_response(bot, payload):
     """Handle mentor check responses."""
     try:
-        print(f"🔍 DEBUG: handle_mentor_response called with payload: {payload}")
+        logger.debug("handle_mentor_response called with payload: %s", payload)
         user_id = payload['user']['id']
         user_name = bot.get_user_name(user_id)
         action_id = payload['actions'][0]['action_id']
@@ -185,20 +191,20 @@ def handle_mentor_response(bot, payload):
         channel_id = payload['channel']['id']
         message_ts = payload['message']['ts']
         
-        print(f"🔍 DEBUG: handle_mentor_response called - Action: {action_id}, Value: {value}")
-        print(f"🔍 DEBUG: User: {user_name} ({user_id})")
-        print(f"🔍 DEBUG: Channel: {channel_id}, Message TS: {message_ts}")
+        logger.debug("handle_mentor_response called - Action: %s, Value: %s", action_id, value)
+        logger.debug("User: %s (%s)", user_name, user_id)
+        logger.debug("Channel: %s, Message TS: %s", channel_id, message_ts)
         
         # Parse value: mentor_yes/request_type/user_id or mentor_no/request_type/user_id
         parts = value.split('_')
-        print(f"🔍 DEBUG: Parsed value parts: {parts}")
+        logger.debug("Parsed value parts: %s", parts)
         
         if len(parts) >= 3:
             mentor_response = parts[1]  # yes or no
             request_type = parts[2]     # kr or blocker
             target_user_id = parts[3]   # user_id
             
-            print(f"🔍 DEBUG: Mentor response: {mentor_response}, Request type: {request_type}, Target user: {target_user_id}")
+            logger.debug("Mentor response: %s, Request type: %s, Target user: %s", mentor_response, request_type, target_user_id)
             
             # Note: Mentor table has been removed as per user request
             
@@ -208,11 +214,11 @@ def handle_mentor_response(bot, payload):
                     search_term = bot.pending_kr_search.get(target_user_id)
                     sprint_number = bot.pending_kr_sprint.get(target_user_id)
                     
-                    print(f"🔍 DEBUG: Found sprint number: {sprint_number}")
-                    print(f"🔍 DEBUG: KR search term: '{search_term}', Sprint: {sprint_number}")
-                    print(f"🔍 DEBUG: All pending data for user {target_user_id}:")
-                    print(f"🔍 DEBUG: - pending_kr_search: {bot.pending_kr_search.get(target_user_id)}")
-                    print(f"🔍 DEBUG: - pending_kr_sprint: {bot.pending_kr_sprint.get(target_user_id)}")
+                    logger.debug("Found sprint number: %s", sprint_number)
+                    logger.debug("KR search term: '%s', Sprint: %s", search_term, sprint_number)
+                    logger.debug("All pending data for user %s:", target_user_id)
+                    logger.debug("- pending_kr_search: %s", bot.pending_kr_search.get(target_user_id))
+                    logger.debug("- pending_kr_sprint: %s", bot.pending_kr_sprint.get(target_user_id))
                     
                     # Send "give me one moment" message first
                     bot.send_dm(target_user_id, "🔍 Give me one moment as it searches...")
@@ -232,10 +238,10 @@ def handle_mentor_response(bot, payload):
                                 
                                 # Use deduplicated results
                                 unique_matches = list(unique_krs.values())
-                                print(f"🔍 DEBUG: Found {len(matches)} total matches, {len(unique_matches)} unique KRs for sprint {sprint_number}")
+                                logger.debug("Found %s total matches, %s unique KRs for sprint %s", len(matches), len(unique_matches), sprint_number)
                                 
                                 # Delete the original mentor check message first
-                                print(f"🔍 DEBUG: Deleting mentor check message")
+                                logger.debug("Deleting mentor check message")
                                 try:
                                     bot.update_message(
                                         channel_id=channel_id,
@@ -246,7 +252,7 @@ def handle_mentor_response(bot, payload):
                                     print(f"❌ Error updating mentor check message: {e}")
                                 
                                 # Send each unique KR as a separate message
-                                print(f"🔍 DEBUG: Sending {len(unique_matches)} unique KR results as separate messages")
+                                logger.debug("Sending %s unique KR results as separate messages", len(unique_matches))
                                 for i, m in enumerate(unique_matches, 1):
                                     kr_name = m.get('c-yQ1M6UqTSj', 'N/A')
                                     owner = m.get('c-efR-vVo_3w', 'N/A')
@@ -263,13 +269,13 @@ def handle_mentor_response(bot, payload):
                                     # Send as separate message
                                     try:
                                         bot.send_dm(target_user_id, kr_message)
-                                        print(f"🔍 DEBUG: Sent KR {i} message")
+                                        logger.debug("Sent KR %s message", i)
                                     except Exception as e:
                                         print(f"❌ Error sending KR {i} message: {e}")
                             else:
                                 # No matches found
                                 result_text = f'No matching KRs found for "{search_term}" in Sprint {sprint_number}.'
-                                print(f"🔍 DEBUG: No matches found, updating mentor check message")
+                                logger.debug("No matches found, updating mentor check message")
                                 bot.update_message(
                                     channel_id=channel_id,
                                     ts=message_ts,
@@ -296,7 +302,7 @@ def handle_mentor_response(bot, payload):
                 elif request_type == 'blocker':
                     # User has reached out to mentor, proceed with blocker form
                     # Send a new message with the blocker button instead of updating
-                    print(f"🔍 DEBUG: Sending new message with blocker button for blocker request")
+                    logger.debug("Sending new message with blocker button for blocker request")
                     
                     help_text = "🚨 *Great! Let me help you submit your blocker details.*\n\nI can help you submit a blocker report that will be escalated to the team so anyone can help resolve it.\n\nClick the button below to open the blocker report form."
                     
@@ -320,13 +326,13 @@ def handle_mentor_response(bot, payload):
                     ]
                     
                     # Send a new message instead of updating
-                    print(f"🔍 DEBUG: Sending DM with blocker button to user: {target_user_id}")
+                    logger.debug("Sending DM with blocker button to user: %s", target_user_id)
                     result = bot.send_dm(target_user_id, help_text, blocks=blocks)
-                    print(f"🔍 DEBUG: send_dm result: {result}")
+                    logger.debug("send_dm result: %s", result)
                     
                     # Also delete the original mentor check message
                     try:
-                        print(f"🔍 DEBUG: Updating original mentor check message")
+                        logger.debug("Updating original mentor check message")
                         bot.update_message(
                             channel_id=channel_id,
                             ts=message_ts,
@@ -338,7 +344,7 @@ def handle_mentor_response(bot, payload):
                     print(f"❌ DEBUG: Unknown request type: {request_type}")
             elif mentor_response == 'no':
                 # Handle "No" response
-                print(f"🔍 DEBUG: Handling mentor 'no' response for {request_type}")
+                logger.debug("Handling mentor 'no' response for %s", request_type)
                 if request_type == 'kr':
                     bot.update_message(
                         channel_id=channel_id,
@@ -348,7 +354,7 @@ def handle_mentor_response(bot, payload):
                 elif request_type == 'blocker':
                     # For blockers, still send the blocker form even if they haven't talked to mentor
                     # This allows them to submit the blocker anyway
-                    print(f"🔍 DEBUG: Sending blocker form despite mentor 'no' response")
+                    logger.debug("Sending blocker form despite mentor 'no' response")
                     
                     help_text = "🚨 *Let me help you submit your blocker details.*\n\nI can help you submit a blocker report that will be escalated to the team so anyone can help resolve it.\n\nClick the button below to open the blocker report form."
                     
@@ -372,13 +378,13 @@ def handle_mentor_response(bot, payload):
                     ]
                     
                     # Send a new message with the blocker button
-                    print(f"🔍 DEBUG: Sending DM with blocker button to user: {target_user_id}")
+                    logger.debug("Sending DM with blocker button to user: %s", target_user_id)
                     result = bot.send_dm(target_user_id, help_text, blocks=blocks)
-                    print(f"🔍 DEBUG: send_dm result: {result}")
+                    logger.debug("send_dm result: %s", result)
                     
                     # Update the original mentor check message
                     try:
-                        print(f"🔍 DEBUG: Updating original mentor check message")
+                        logger.debug("Updating original mentor check message")
                         bot.update_message(
                             channel_id=channel_id,
                             ts=message_ts,
@@ -392,10 +398,8 @@ def handle_mentor_response(bot, payload):
             print(f"❌ DEBUG: Could not parse mentor response value: {value}")
         
         return {"response_action": "clear"}
-    except Exception as e:
-        print(f"❌ Error in handle_mentor_response: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_mentor_response")
         return {"response_action": "clear"}
 
 def handle_blocker_followup_response(bot, payload):
@@ -417,13 +421,13 @@ def handle_blocker_followup_response(bot, payload):
             bot.send_dm(user_id, "❌ Error processing button click. Please try again.")
             return {"response_action": "clear"}
         
-        print(f"🔍 DEBUG: Parsed 24hr followup - user_id: {target_user_id}, kr_name: {kr_name}")
+        logger.debug("Parsed 24hr followup - user_id: %s, kr_name: %s", target_user_id, kr_name)
         
         if action_id in ['blocker_resolved', 'claim_and_resolve_blocker', 'blocker_resolved_24hr']:
             # Open a modal to collect resolution notes
-            print(f"🔍 DEBUG: Opening resolution modal for action: {action_id}")
-            print(f"🔍 DEBUG: Payload keys: {list(payload.keys())}")
-            print(f"🔍 DEBUG: Trigger ID available: {'trigger_id' in payload}")
+            logger.debug("Opening resolution modal for action: %s", action_id)
+            logger.debug("Payload keys: %s", list(payload.keys()))
+            logger.debug("Trigger ID available: %s", 'trigger_id' in payload)
             try:
                 modal_view = {
                     "type": "modal",
@@ -481,7 +485,7 @@ def handle_blocker_followup_response(bot, payload):
                         bot.update_message(channel_id, payload['message']['ts'], 
                                          f"✅ *Blocker for {kr_name} has been resolved by @{user_name}* - Resolution details requested.")
                     else:
-                        print(f"🔍 DEBUG: No channel/message context available for updating")
+                        logger.debug("No channel/message context available for updating")
                 except Exception as e:
                     print(f"❌ Error updating message: {e}")
                     
@@ -504,7 +508,7 @@ def handle_blocker_followup_response(bot, payload):
             bot.send_dm(user_id, f"I'll re-escalate your blocker for {kr_name} to the team so anyone can help resolve it.")
             # Re-escalate to the escalation channel
             try:
-                escalation_channel = f"#{bot.config.SLACK_ESCALATION_CHANNEL}" if bot.config.SLACK_ESCALATION_CHANNEL else "#leads"
+                escalation_channel = bot.get_channel_id(bot.config.SLACK_ESCALATION_CHANNEL or "leads")
                 bot.client.chat_postMessage(
                     channel=escalation_channel,
                     text=f"🚨 *Blocker Re-escalated*\n\n<@{user_id}> is still blocked on *{kr_name}* after 24 hours and needs help. Anyone can claim this!",
@@ -616,12 +620,11 @@ def handle_view_submission(bot, payload):
     try:
         callback_id = payload.get('view', {}).get('callback_id', '')
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         
-        print(f"🔍 DEBUG: handle_view_submission called with callback_id: '{callback_id}' for user: {user_name}")
+        # Slack is waiting on the response_action below, so no users.info call here
+        logger.debug("handle_view_submission called with callback_id: '%s' for user: %s", callback_id, user_id)
         
         # Enhanced submission tracking to prevent duplicates
-        submission_key = f"{user_id}_{callback_id}_{int(time.time())}"
         if not hasattr(bot, 'recent_submissions'):
             bot.recent_submissions = {}
         
@@ -635,7 +638,7 @@ def handle_view_submission(bot, payload):
         
         # Check if this callback_id was recently submitted
         if callback_id in recent_submissions:
-            print(f"🔍 DEBUG: Duplicate submission detected for {user_name} with callback_id: {callback_id}")
+            logger.debug("Duplicate submission detected for %s with callback_id: %s", user_id, callback_id)
             return {"response_action": "clear"}
         
         # Track this submission
@@ -753,16 +756,14 @@ def handle_checkin_submission(bot, payload):
                 # Save to Coda
                 if bot.coda:
                     try:
-                        success = bot.coda.add_standup_response(
+                        # Queued and written to Coda in batches with other check-ins
+                        bot.coda.queue_standup_response(
                             user_id=user_id,
                             response_text=f"Today: {status}\nOn Track: {track_display}\nBlockers: {blockers_display}\nNotes: {notes}" if notes else f"Today: {status}\nOn Track: {track_display}\nBlockers: {blockers_display}",
                             username=user_name,
                             is_late=is_late
                         )
-                        if success:
-                            print(f"✅ Checkin response saved to Coda for {user_name}")
-                        else:
-                            print(f"❌ Failed to save checkin response to Coda for {user_name}")
+                        print(f"✅ Checkin response queued for Coda for {user_name}")
                     except Exception as e:
                         print(f"❌ Error saving checkin response to Coda: {e}")
                 else:
@@ -842,7 +843,7 @@ def handle_checkin_submission(bot, payload):
 
 def handle_blocker_details_submission(bot, payload):
     """Handle blocker details modal submission from the blocker report form."""
-    print(f"🔍 DEBUG: handle_blocker_details_submission called")
+    logger.debug("handle_blocker_details_submission called")
     try:
         user_id = payload['user']['id']
         user_name = bot.get_user_name(user_id)
@@ -855,7 +856,7 @@ def handle_blocker_details_submission(bot, payload):
         urgency = values.get('urgency', {}).get('urgency_input', {}).get('selected_option', {}).get('value', 'medium')
         notes = values.get('notes', {}).get('notes_input', {}).get('value', '').strip()
         
-        print(f"🔍 DEBUG: Extracted blocker details - Sprint: {sprint_number}, Description: {blocker_description}, KR: {kr_name}, Urgency: {urgency}, Notes: {notes}")
+        logger.debug("Extracted blocker details - Sprint: %s, Description: %s, KR: %s, Urgency: %s, Notes: %s", sprint_number, blocker_description, kr_name, urgency, notes)
         
         # Validate required fields
         if not blocker_description:
@@ -1057,36 +1058,48 @@ def handle_progress_update_submission(bot, payload):
 def handle_events(bot, payload):
     """Handle Slack events."""
     try:
-        event_type = payload.get('type')
+        # Slack always sends these fields, so index directly; a malformed payload
+        # lands in the KeyError branch below instead of flowing through as None
+        event_type = payload['type']
         
         if event_type == 'url_verification':
-            return payload.get('challenge')
+            return payload['challenge']
         
         if event_type == 'event_callback':
-            event = payload.get('event', {})
-            event_subtype = event.get('subtype')
+            event = payload['event']
             
-            # Skip bot messages and message edits
-            if event_subtype in ['bot_message', 'message_changed']:
+            # Route by event type with one dict lookup; types we never act on
+            # return before the subtype filter or dedup store are touched
+            handler = _EVENT_HANDLERS.get(event['type'])
+            if handler is None:
                 return "OK"
             
-            # Handle different event types
-            if event.get('type') == 'message':
-                return _handle_message_event(bot, event)
-            elif event.get('type') == 'reaction_added':
-                return _handle_reaction_event(bot, event)
+            # Skip bot messages, edits, deletes and membership noise
+            if event.get('subtype') in _IGNORED_SUBTYPES:
+                return "OK"
+            
+            # Slack redelivers events it thinks went unacked; handle each event_id once
+            event_id = payload.get('event_id')
+            if event_id and not bot.processed_events.check_and_add(event_id):
+                return "OK"
+            
+            return handler(bot, event)
         
         return "OK"
-    except Exception as e:
-        print(f"Error handling events: {e}")
+    except KeyError as e:
+        logger.warning("Malformed event payload, missing field %s", e)
+        return "OK"
+    except Exception:
+        logger.exception("Error handling events")
         return "Error"
 
 def _handle_message_event(bot, event):
     """Handle message events."""
     try:
+        # Read each field once into locals; the branches below reuse them
         user_id = event.get('user')
         text = event.get('text', '')
-        channel_id = event.get('channel')
+        channel_id = event.get('channel', '')
         thread_ts = event.get('thread_ts')
         message_ts = event.get('ts')
         
@@ -1094,74 +1107,153 @@ def _handle_message_event(bot, event):
             return "OK"
         
         # Skip bot messages to prevent processing our own messages
-        if 'bot_id' in event or user_id == bot.config.SLACK_BOT_USER_ID:
+        if 'bot_id' in event or user_id == bot.bot_user_id:
             return "OK"
         
         # Check if this is a DM (channel starts with 'D')
         is_dm = channel_id.startswith('D')
         
         if is_dm:
-            # Check if this is a reply to a standup prompt (has thread_ts)
-            if thread_ts:
-                print(f"🔍 DEBUG: Processing as standup response (in thread)")
-                # This is a reply in a DM (standup response)
-                bot.handle_standup_response(
-                    user_id=user_id,
-                    message_ts=message_ts,
-                    thread_ts=thread_ts,
-                    text=text,
-                    channel_id=channel_id
-                )
-                return "standup_response_processed"
-            
-            # Handle commands in DM
-            if bot.handle_commands(user_id, text, channel_id):
-                return "command_processed"
+            result = _handle_dm_message(bot, user_id, text, channel_id, thread_ts, message_ts)
+            if result:
+                return result
         
         # Check for bot mentions
-        if f'<@{bot.config.SLACK_BOT_USER_ID}>' in text:
+        if bot.bot_mention in text:
             return _handle_bot_mention(bot, user_id, text, channel_id)
         
-        # Check for specific keywords
-        if any(keyword in text.lower() for keyword in ['blocker', 'blocked', 'stuck']):
+        # Check for specific keywords (lowercase the text once, not per keyword)
+        lowered_text = text.lower()
+        if any(keyword in lowered_text for keyword in _BLOCKER_KEYWORDS):
             return _handle_blocker_keyword(bot, user_id, text, channel_id)
         
         return "OK"
-    except Exception as e:
-        print(f"Error handling message event: {e}")
+    except Exception:
+        logger.exception("Error handling message event")
         return "Error"
 
+def _handle_dm_message(bot, user_id, text, channel_id, thread_ts, message_ts):
+    """Handle a DM message: standup thread replies and text commands.
+    
+    Shared by the 'message' and 'message.im' event paths. Returns a status
+    string when the message was handled, or None to fall through.
+    """
+    # Check if this is a reply to a standup prompt (has thread_ts)
+    if thread_ts:
+        logger.debug("Processing DM from %s as standup response (in thread)", user_id)
+        # This is a reply in a DM (standup response)
+        bot.handle_standup_response(
+            user_id=user_id,
+            message_ts=message_ts,
+            thread_ts=thread_ts,
+            text=text,
+            channel_id=channel_id
+        )
+        return "standup_response_processed"
+    
+    # Handle commands in DM
+    if bot.handle_commands(user_id, text, channel_id):
+        return "command_processed"
+    
+    return None
+
 def _handle_reaction_event(bot, event):
     """Handle reaction events."""
     try:
-        user_id = event.get('user')
-        reaction = event.get('reaction')
-        item = event.get('item', {})
+        reaction = event['reaction']
+        # Most reactions are ordinary emoji; drop them before touching anything else
+        if reaction not in _HANDLED_REACTIONS:
+            return "OK"
+        
+        user_id = event['user']
+        item = event['item']
+        
+        # Every branch below is about reactions on messages (not files)
+        if item['type'] != 'message':
+            return "OK"
+        message_ts = item['ts']
         
         # Handle daily standup reactions
-        if reaction in ['white_check_mark', 'warning', 'rotating_light'] and item.get('type') == 'message':
-            message_ts = item.get('ts')
+        if reaction in ['white_check_mark', 'warning', 'rotating_light']:
             if message_ts in bot.active_standups:
                 bot.handle_quick_reaction(user_id, message_ts, reaction)
                 return "OK"
         
-        if reaction == 'white_check_mark' and item.get('type') == 'message':
+        # Handle :sos: / :clock4: on a standup followup, found via the ts -> user index
+        if reaction in ['sos', 'clock4']:
+            followup_user_id = bot.followup_ts_to_user.get(message_ts)
+            user_data = bot.user_responses.get(followup_user_id) if followup_user_id == user_id else None
+            if user_data:
+                if reaction == 'sos':
+                    bot.escalate_issue(user_id, user_data.user_name, user_data.parsed_data)
+                else:
+                    _send_monitor_ack(bot, user_id, user_data.user_name)
+                return "OK"
+        
+        if reaction == 'white_check_mark':
             # Handle completion reaction
             return _handle_completion_reaction(bot, user_id, item)
         
         return "OK"
-    except Exception as e:
-        print(f"Error handling reaction event: {e}")
+    except KeyError as e:
+        logger.warning("Malformed reaction event, missing field %s", e)
+        return "OK"
+    except Exception:
+        logger.exception("Error handling reaction event")
+        return "Error"
+
+def _handle_user_change_event(bot, event):
+    """Refresh cached user data when someone joins or their profile changes."""
+    bot.invalidate_user_cache(event.get('user'))
+    return "OK"
+
+def _handle_channel_change_event(bot, event):
+    """Reload the channel name -> ID map when channels are created, renamed or archived."""
+    bot.invalidate_channel_cache()
+    return "OK"
+
+def handle_slash_command(bot, payload):
+    """Handle a slash command (/kr, /checkin, /blocked, ...) delivered over Socket Mode."""
+    try:
+        command = payload.get('command', '').lstrip('/').lower()
+        text = payload.get('text', '').strip()
+        user_id = payload.get('user_id')
+        channel_id = payload.get('channel_id')
+        
+        # Import the command processing function
+        from .commands import _process_command
+        _process_command(bot, user_id, command, text, channel_id)
+        return "OK"
+    except Exception:
+        logger.exception("Error handling slash command")
         return "Error"
 
+# Event type -> handler ('message.im' shares the message path)
+_EVENT_HANDLERS = {
+    'message': _handle_message_event,
+    'message.im': _handle_message_event,
+    'reaction_added': _handle_reaction_event,
+    # Cache invalidation; the caches' TTLs only cover missed events
+    'team_join': _handle_user_change_event,
+    'user_change': _handle_user_change_event,
+    'channel_created': _handle_channel_change_event,
+    'channel_rename': _handle_channel_change_event,
+    'channel_archive': _handle_channel_change_event,
+    'channel_unarchive': _handle_channel_change_event,
+    'channel_deleted': _handle_channel_change_event,
+}
+
+def _send_monitor_ack(bot, user_id, user_name):
+    """Acknowledge a 'can wait' answer to a standup followup (:clock4: reaction or button)."""
+    bot.send_dm(user_id, f"@{user_name} Thanks for letting us know. We'll check in with you later if needed.")
+
 def _handle_bot_mention(bot, user_id, text, channel_id):
     """Handle bot mentions."""
     try:
         user_name = bot.get_user_name(user_id)
         
         # Extract command from mention
-        mention_pattern = f'<@{bot.config.SLACK_BOT_USER_ID}>'
-        command_text = text.replace(mention_pattern, '').strip()
+        command_text = text.replace(bot.bot_mention, '').strip()
         
         if not command_text:
             # Show help
@@ -1185,8 +1277,8 @@ def _handle_bot_mention(bot, user_id, text, channel_id):
         from .commands import _process_command
         _process_command(bot, user_id, command, text_param, channel_id)
         return "OK"
-    except Exception as e:
-        print(f"Error handling bot mention: {e}")
+    except Exception:
+        logger.exception("Error handling bot mention")
         return "Error"
 
 def _handle_blocker_keyword(bot, user_id, text, channel_id):
@@ -1195,7 +1287,8 @@ def _handle_blocker_keyword(bot, user_id, text, channel_id):
         user_name = bot.get_user_name(user_id)
         
         # Check if this is a new blocker report
-        if 'blocker' in text.lower() or 'blocked' in text.lower():
+        lowered_text = text.lower()
+        if 'blocker' in lowered_text or 'blocked' in lowered_text:
             # Ask if they want to report a blocker
             blocks = [
                 {
@@ -1226,8 +1319,8 @@ def _handle_blocker_keyword(bot, user_id, text, channel_id):
             bot.send_message(channel_id, "", blocks=blocks)
         
         return "OK"
-    except Exception as e:
-        print(f"Error handling blocker keyword: {e}")
+    except Exception:
+        logger.exception("Error handling blocker keyword")
         return "Error"
 
 def _handle_completion_reaction(bot, user_id, item):
@@ -1235,10 +1328,10 @@ def _handle_completion_reaction(bot, user_id, item):
     try:
         # This could be used to mark items as complete
         # For now, just log it
-        print(f"User {user_id} marked item {item.get('ts')} as complete")
+        logger.info("User %s marked item %s as complete", user_id, item.get('ts'))
         return "OK"
-    except Exception as e:
-        print(f"Error handling completion reaction: {e}")
+    except Exception:
+        logger.exception("Error handling completion reaction")
         return "Error"
 
 # Removed Flask webhook routes - using Socket Mode instead
@@ -1451,17 +1544,14 @@ def handle_health_response(bot, payload):
         
         return {"response_action": "clear"}
         
-    except Exception as e:
-        print(f"❌ Error in handle_health_response: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_health_response")
         return {"response_action": "clear"}
 
 def handle_update_progress(bot, payload):
     """Handle update progress button click."""
     try:
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         trigger_id = payload['trigger_id']
         value = payload['actions'][0]['value']
         
@@ -1531,8 +1621,6 @@ def handle_update_progress(bot, payload):
 def handle_mark_resolved(bot, payload):
     """Handle mark resolved button click."""
     try:
-        user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         value = payload['actions'][0]['value']
         channel_id = payload['channel']['id']
         message_ts = payload['message']['ts']
@@ -1621,15 +1709,13 @@ def handle_daily_checkin_submission(bot, payload):
             try:
                 # Combine the responses into a single text
                 response_text = f"Yesterday: {yesterday}\nToday: {today}\nBlockers: {blockers}"
-                success = bot.coda.add_standup_response(
+                # Queued so the modal's response doesn't wait on a Coda round-trip
+                bot.coda.queue_standup_response(
                     user_id=user_id,
                     response_text=response_text,
                     username=user_name
                 )
-                if success:
-                    print(f"✅ Daily checkin response saved to Coda for {user_name}")
-                else:
-                    print(f"❌ Failed to save daily checkin response to Coda for {user_name}")
+                print(f"✅ Daily checkin response queued for Coda for {user_name}")
             except Exception as e:
                 print(f"❌ Error saving daily checkin response to Coda: {e}")
         else:
@@ -1658,8 +1744,6 @@ def handle_daily_checkin_submission(bot, payload):
 def handle_view_blocker_details(bot, payload):
     """Handle view blocker details button click."""
     try:
-        user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         value = payload['actions'][0]['value']
         channel_id = payload['channel']['id']
         message_ts = payload['message']['ts']
@@ -1681,8 +1765,6 @@ def handle_view_blocker_details(bot, payload):
 def handle_view_details(bot, payload):
     """Handle view details button click - shows comprehensive KR details and replaces reply message."""
     try:
-        user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         value = payload['actions'][0]['value']
         channel_id = payload['channel']['id']
         message_ts = payload['message']['ts']
@@ -1699,7 +1781,7 @@ def handle_view_details(bot, payload):
             if parts[1] == "details":
                 user_id_from_button = parts[2]
                 kr_name = '_'.join(parts[3:])  # KR name might contain underscores and spaces
-                print(f"🔍 DEBUG: Parsed user_id: {user_id_from_button}, kr_name: {kr_name}")
+                logger.debug("Parsed user_id: %s, kr_name: %s", user_id_from_button, kr_name)
                 
                 # For now, we'll use a placeholder blocker_id since we don't have the full blocker details
                 blocker_id = f"view_details_{user_id_from_button}_{int(time.time())}"
@@ -1782,16 +1864,16 @@ def handle_view_details(bot, payload):
         # Create a more persistent key for message replacement using KR name and channel
         # This prevents spam even when bot restarts
         message_key = f"{kr_name}_{channel_id}"
-        print(f"🔍 DEBUG: Using message key '{message_key}' for KR '{kr_name}' in channel '{channel_id}'")
-        print(f"🔍 DEBUG: active_blockers keys: {list(bot.active_blockers.keys()) if hasattr(bot, 'active_blockers') else 'None'}")
+        logger.debug("Using message key '%s' for KR '%s' in channel '%s'", message_key, kr_name, channel_id)
+        logger.debug("active_blockers keys: %s", list(bot.active_blockers.keys()) if hasattr(bot, 'active_blockers') else 'None')
         
         # Check if we have a stored reply timestamp for this KR in this channel
         if message_key in bot.active_blockers:
             blocker_info = bot.active_blockers[message_key]
             reply_ts = blocker_info.get('details_reply_ts')
-            print(f"🔍 DEBUG: Found existing message info, details_reply_ts: {reply_ts}")
+            logger.debug("Found existing message info, details_reply_ts: %s", reply_ts)
         else:
-            print(f"🔍 DEBUG: Message key '{message_key}' not found - creating entry to prevent spam")
+            logger.debug("Message key '%s' not found - creating entry to prevent spam", message_key)
             # Create a new entry for this KR/channel combination to prevent future spam
             bot.active_blockers[message_key] = {
                 'kr_name': kr_name,
@@ -1830,8 +1912,6 @@ def handle_view_details(bot, payload):
 def handle_submit_blocker_details(bot, payload):
     """Handle submit blocker details button click."""
     try:
-        user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         trigger_id = payload['trigger_id']
         
         # Create blocker details modal
@@ -1905,7 +1985,6 @@ def handle_followup_response(bot, payload):
     try:
         action_id = payload['actions'][0]['action_id']
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         trigger_id = payload['trigger_id']
         
         if action_id == 'escalate_help':
@@ -1971,8 +2050,10 @@ def handle_followup_response(bot, payload):
             )
             
         elif action_id == 'monitor_issue':
-            # User can wait - acknowledge
-            bot.send_dm(user_id, f"@{user_name} Thanks for letting us know. We'll check in with you later if needed.")
+            # User can wait - acknowledge (name from the followup we stored, else users.info)
+            user_data = bot.user_responses.get(user_id)
+            user_name = user_data.user_name if user_data else bot.get_user_name(user_id)
+            _send_monitor_ack(bot, user_id, user_name)
         
         return {"text": "OK"}
     except Exception as e:
@@ -1983,7 +2064,6 @@ def handle_health_share_response(bot, payload):
     """Handle health share response (public/private/no thanks) with background processing."""
     try:
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         action_id = payload['actions'][0]['action_id']
         
         # Get the stored mood
@@ -2125,7 +2205,6 @@ def handle_health_no_share(bot, payload):
     """Handle health check no share response with background processing."""
     try:
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         
         # Send immediate confirmation
         bot.send_dm(user_id, "✅ Processing your response in background...")
@@ -2222,7 +2301,7 @@ def handle_blocker_completion_submission(bot, payload):
             bot.send_dm(user_id, "❌ Error: Could not identify which blocker to complete. Please try again.")
             return {"response_action": "clear"}
         
-        print(f"🔍 DEBUG: Completing blocker {blocker_id} with resolution: {resolution_notes}")
+        logger.debug("Completing blocker %s with resolution: %s", blocker_id, resolution_notes)
         
         # Get blocker details from Coda
         if bot.coda:
@@ -2535,22 +2614,22 @@ def handle_blocker_channel_resolution_submission(bot, payload):
 def handle_open_blocker_report_modal(bot, payload):
     """Handle opening the blocker report modal."""
     try:
-        print(f"🔍 DEBUG: handle_open_blocker_report_modal called with payload: {payload}")
+        logger.debug("handle_open_blocker_report_modal called with payload: %s", payload)
         
         # Get the correct user ID from the mentor check value in the button
         actions = payload.get('actions', [])
         if actions:
             value = actions[0].get('value', '')
-            print(f"🔍 DEBUG: Button value: {value}")
+            logger.debug("Button value: %s", value)
             
             # Parse the value to get the actual user ID
             parts = value.split('_')
             if len(parts) >= 3 and parts[0] == 'checkin' and parts[1] == 'prompt':
                 actual_user_id = parts[2]  # The user ID is the 3rd part
-                print(f"🔍 DEBUG: Actual user ID from button value: {actual_user_id}")
+                logger.debug("Actual user ID from button value: %s", actual_user_id)
             elif len(parts) >= 3 and parts[0] == 'blocker' and parts[1] == 'report':
                 actual_user_id = parts[2]  # The user ID is the 3rd part
-                print(f"🔍 DEBUG: Actual user ID from button value: {actual_user_id}")
+                logger.debug("Actual user ID from button value: %s", actual_user_id)
             else:
                 print(f"❌ DEBUG: Could not parse user ID from button value: {value}")
                 return {"response_action": "clear"}
@@ -2559,7 +2638,7 @@ def handle_open_blocker_report_modal(bot, payload):
             return {"response_action": "clear"}
         
         user_name = bot.get_user_name(actual_user_id)
-        print(f"🔍 DEBUG: Creating blocker form for user: {user_name}")
+        logger.debug("Creating blocker form for user: %s", user_name)
         
         # Open a modal with the blocker form (same as checkin)
         trigger_id = payload.get('trigger_id')
@@ -2639,20 +2718,18 @@ def handle_open_blocker_report_modal(bot, payload):
             submit_text="Submit Blocker",
             callback_id="blocker_details_submit"
         )
-        print(f"🔍 DEBUG: Blocker modal opened: {result}")
+        logger.debug("Blocker modal opened: %s", result)
         
         return {"response_action": "clear"}
         
-    except Exception as e:
-        print(f"❌ Error in handle_open_blocker_report_modal: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_open_blocker_report_modal")
         return {"response_action": "clear"}
 
 def handle_submit_blocker_form(bot, payload):
     """Handle submission of the blocker form from interactive blocks with duplicate prevention."""
     try:
-        print(f"🔍 DEBUG: handle_submit_blocker_form called with payload: {payload}")
+        logger.debug("handle_submit_blocker_form called with payload: %s", payload)
         
         user_id = payload['user']['id']
         user_name = bot.get_user_name(user_id)
@@ -2670,7 +2747,7 @@ def handle_submit_blocker_form(bot, payload):
         urgency = values.get('urgency', {}).get('urgency_select', {}).get('selected_option', {}).get('value', 'medium')
         notes = values.get('notes', {}).get('notes_input', {}).get('value', '')
         
-        print(f"🔍 DEBUG: Form data - Sprint: {sprint_number}, KR: {kr_name}, Description: {blocker_description}, Urgency: {urgency}, Notes: {notes}")
+        logger.debug("Form data - Sprint: %s, KR: %s, Description: %s, Urgency: %s, Notes: %s", sprint_number, kr_name, blocker_description, urgency, notes)
         
         # Validate required fields
         missing_fields = []
@@ -2741,30 +2818,25 @@ def handle_submit_blocker_form(bot, payload):
         
         return {"response_action": "clear"}
         
-    except Exception as e:
-        print(f"❌ Error in handle_submit_blocker_form: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_submit_blocker_form")
         return {"response_action": "clear"}
 
 def handle_open_blocker_modal_channel(bot, payload):
     """Handle opening the blocker modal from the public channel."""
     try:
-        print(f"🔍 DEBUG: handle_open_blocker_modal_channel called with payload: {payload}")
-        
-        user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
+        logger.debug("handle_open_blocker_modal_channel called with payload: %s", payload)
         
         # Get the user ID from the button value
         actions = payload.get('actions', [])
         if actions:
             value = actions[0].get('value', '')
-            print(f"🔍 DEBUG: Button value: {value}")
+            logger.debug("Button value: %s", value)
             
             parts = value.split('_')
             if len(parts) >= 3 and parts[0] == 'blocker' and parts[1] == 'modal':
                 actual_user_id = parts[2]
-                print(f"🔍 DEBUG: Actual user ID from button value: {actual_user_id}")
+                logger.debug("Actual user ID from button value: %s", actual_user_id)
             else:
                 print(f"❌ DEBUG: Could not parse user ID from button value: {value}")
                 return {"response_action": "clear"}
@@ -2774,7 +2846,7 @@ def handle_open_blocker_modal_channel(bot, payload):
         
         # Check if trigger_id exists (should exist in public channel)
         trigger_id = payload.get('trigger_id')
-        print(f"🔍 DEBUG: trigger_id: {trigger_id}")
+        logger.debug("trigger_id: %s", trigger_id)
         
         if not trigger_id:
             print(f"❌ DEBUG: No trigger_id found in channel payload")
@@ -2848,30 +2920,27 @@ def handle_open_blocker_modal_channel(bot, payload):
             print(f"❌ DEBUG: Failed to open blocker report modal from channel")
         
         return {"response_action": "clear"}
-    except Exception as e:
-        print(f"❌ Error in handle_open_blocker_modal_channel: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_open_blocker_modal_channel")
         return {"response_action": "clear"}
 
 def handle_open_checkin_modal(bot, payload):
     """Handle opening the checkin modal from the DM."""
     try:
-        print(f"🔍 DEBUG: handle_open_checkin_modal called with payload: {payload}")
+        logger.debug("handle_open_checkin_modal called with payload: %s", payload)
         
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         
         # Get the user ID from the button value
         actions = payload.get('actions', [])
         if actions:
             value = actions[0].get('value', '')
-            print(f"🔍 DEBUG: Button value: {value}")
+            logger.debug("Button value: %s", value)
             
             parts = value.split('_')
             if len(parts) >= 3 and parts[0] == 'open' and parts[1] == 'checkin':
                 actual_user_id = parts[2]
-                print(f"🔍 DEBUG: Actual user ID from button value: {actual_user_id}")
+                logger.debug("Actual user ID from button value: %s", actual_user_id)
             else:
                 print(f"❌ DEBUG: Could not parse user ID from button value: {value}")
                 return {"response_action": "clear"}
@@ -2881,7 +2950,7 @@ def handle_open_checkin_modal(bot, payload):
         
         # Check if trigger_id exists
         trigger_id = payload.get('trigger_id')
-        print(f"🔍 DEBUG: trigger_id: {trigger_id}")
+        logger.debug("trigger_id: %s", trigger_id)
         
         if not trigger_id:
             print(f"❌ DEBUG: No trigger_id found in payload")
@@ -2896,17 +2965,14 @@ def handle_open_checkin_modal(bot, payload):
             print(f"❌ DEBUG: Failed to open checkin modal")
         
         return {"response_action": "clear"}
-    except Exception as e:
-        print(f"❌ Error in handle_open_checkin_modal: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_open_checkin_modal")
         return {"response_action": "clear"}
 
 def handle_checkin_no_blocker(bot, payload):
     """Handle when user clicks 'No Blocker to Report' after check-in prompt."""
     try:
         user_id = payload['user']['id']
-        user_name = bot.get_user_name(user_id)
         
         # Send acknowledgment message
         bot.send_dm(user_id, "✅ Understood! No blocker to report. If you encounter any issues later, feel free to use `/blocked` to report them.")
@@ -2932,12 +2998,12 @@ def handle_blocker_sprint_modal_submission(bot, payload):
                 sprint_input = values.get('sprint_input', {}).get('sprint_number', {})
                 sprint_number = sprint_input.get('value', '').strip()
                 
-                print(f"🔍 DEBUG: Processing blocker sprint command for user {user_name}, sprint: '{sprint_number}'")
+                logger.debug("Processing blocker sprint command for user %s, sprint: '%s'", user_name, sprint_number)
                 
                 # Get user's blockers filtered by sprint
                 try:
                     blockers = bot.coda.get_user_blockers_by_sprint(user_id, sprint_number if sprint_number else None)
-                    print(f"🔍 DEBUG: Blockers fetched: {len(blockers)} blockers")
+                    logger.debug("Blockers fetched: %s blockers", len(blockers))
                     
                     if not blockers:
                         sprint_text = f" in Sprint {sprint_number}" if sprint_number else ""
@@ -2982,7 +3048,7 @@ def handle_blocker_sprint_modal_submission(bot, payload):
                         })
                     
                     sprint_header = f" (Sprint {sprint_number})" if sprint_number else ""
-                    print(f"🔍 DEBUG: Sending blocker list with blocks: {len(blocks)} blocks")
+                    logger.debug("Sending blocker list with blocks: %s blocks", len(blocks))
                     bot.send_dm(user_id, f"Here are your current blockers{sprint_header}:", blocks=blocks)
                     
                 except Exception as e:
@@ -3013,12 +3079,12 @@ def handle_view_all_blockers(bot, payload):
                 user_id = payload['user']['id']
                 user_name = bot.get_user_name(user_id)
                 
-                print(f"🔍 DEBUG: Processing view all blockers for user {user_name}")
+                logger.debug("Processing view all blockers for user %s", user_name)
                 
                 # Get user's blockers (no sprint filter)
                 try:
                     blockers = bot.coda.get_user_blockers_by_sprint(user_id, None)
-                    print(f"🔍 DEBUG: Blockers fetched: {len(blockers)} blockers")
+                    logger.debug("Blockers fetched: %s blockers", len(blockers))
                     
                     if not blockers:
                         bot.send_dm(user_id, "You have no active blockers.")
@@ -3059,7 +3125,7 @@ def handle_view_all_blockers(bot, payload):
                             ]
                         })
                     
-                    print(f"🔍 DEBUG: Sending blocker list with blocks: {len(blocks)} blocks")
+                    logger.debug("Sending blocker list with blocks: %s blocks", len(blocks))
                     bot.send_dm(user_id, "Here are your current blockers:", blocks=blocks)
                     
                 except Exception as e:
@@ -3381,12 +3447,12 @@ def handle_view_blockers_with_sprint(bot, payload):
                 # For now, show all blockers (no sprint filtering)
                 sprint_number = None
                 
-                print(f"🔍 DEBUG: Processing view blockers command for user {user_name}, sprint: '{sprint_number}'")
+                logger.debug("Processing view blockers command for user %s, sprint: '%s'", user_name, sprint_number)
                 
                 # Get user's blockers filtered by sprint
                 try:
                     blockers = bot.coda.get_user_blockers_by_sprint(user_id, sprint_number if sprint_number else None)
-                    print(f"🔍 DEBUG: Blockers fetched: {len(blockers)} blockers")
+                    logger.debug("Blockers fetched: %s blockers", len(blockers))
                     
                     if not blockers:
                         sprint_text = f" in Sprint {sprint_number}" if sprint_number else ""
@@ -3431,7 +3497,7 @@ def handle_view_blockers_with_sprint(bot, payload):
                         })
                     
                     sprint_header = f" (Sprint {sprint_number})" if sprint_number else ""
-                    print(f"🔍 DEBUG: Sending blocker list with blocks: {len(blocks)} blocks")
+                    logger.debug("Sending blocker list with blocks: %s blocks", len(blocks))
                     bot.send_dm(user_id, f"Here are your current blockers{sprint_header}:", blocks=blocks)
                     
                 except Exception as e:
@@ -3463,12 +3529,12 @@ def handle_view_blockers_modal(bot, payload):
         sprint_input = values.get('sprint_number', {}).get('sprint_number_input', {})
         sprint_number = sprint_input.get('value', '').strip()
         
-        print(f"🔍 DEBUG: Processing view blockers modal for user {user_name}, sprint: '{sprint_number}'")
+        logger.debug("Processing view blockers modal for user %s, sprint: '%s'", user_name, sprint_number)
         
         # Get user's blockers filtered by sprint
         try:
             blockers = bot.coda.get_user_blockers_by_sprint(user_id, sprint_number if sprint_number else None)
-            print(f"🔍 DEBUG: Blockers fetched: {len(blockers)} blockers")
+            logger.debug("Blockers fetched: %s blockers", len(blockers))
             
             if not blockers:
                 sprint_text = f" in Sprint {sprint_number}" if sprint_number else ""
@@ -3501,7 +3567,7 @@ def handle_view_blockers_modal(bot, payload):
                 })
             
             sprint_header = f" (Sprint {sprint_number})" if sprint_number else ""
-            print(f"🔍 DEBUG: Sending blocker list with blocks: {len(blocks)} blocks")
+            logger.debug("Sending blocker list with blocks: %s blocks", len(blocks))
             bot.send_dm(user_id, f"Here are your current blockers{sprint_header}:", blocks=blocks)
             
         except Exception as e:
@@ -3520,7 +3586,7 @@ def handle_open_view_blockers_modal(bot, payload):
         user_id = payload['user']['id']
         user_name = bot.get_user_name(user_id)
         
-        print(f"🔍 DEBUG: Opening view blockers modal for user {user_name}")
+        logger.debug("Opening view blockers modal for user %s", user_name)
         
         # Create modal view
         modal_view = {
@@ -3579,7 +3645,7 @@ def handle_kr_continue_submit(bot, payload):
         search_term = values.get('search_term', {}).get('search_term', {}).get('value', '').strip()
         sprint_number = values.get('sprint_number', {}).get('sprint_number', {}).get('value', '').strip()
         
-        print(f"🔍 DEBUG: KR continue submit - search_term: '{search_term}', sprint_number: '{sprint_number}'")
+        logger.debug("KR continue submit - search_term: '%s', sprint_number: '%s'", search_term, sprint_number)
         
         # Validate required fields
         if not search_term:
@@ -3652,7 +3718,7 @@ def handle_blocker_continue_submit(bot, payload):
         notes = values.get('notes', {}).get('notes', {}).get('value', '').strip()
         sprint_number = values.get('sprint_number', {}).get('sprint_number', {}).get('value', '').strip()
         
-        print(f"🔍 DEBUG: Blocker continue submit - kr_name: '{kr_name}', description: '{blocker_description[:50]}...', urgency: '{urgency}', sprint: '{sprint_number}'")
+        logger.debug("Blocker continue submit - kr_name: '%s', description: '%s...', urgency: '%s', sprint: '%s'", kr_name, blocker_description[:50], urgency, sprint_number)
         
         # Validate required fields
         if not kr_name:
@@ -3711,18 +3777,18 @@ def handle_blocker_continue_submit(bot, payload):
 def handle_24hr_resolution_submission(bot, payload):
     """Handle 24-hour blocker resolution submission."""
     try:
-        print(f"🔍 DEBUG: handle_24hr_resolution_submission called with payload type: {payload.get('type', 'unknown')}")
-        print(f"🔍 DEBUG: Payload keys: {list(payload.keys())}")
+        logger.debug("handle_24hr_resolution_submission called with payload type: %s", payload.get('type', 'unknown'))
+        logger.debug("Payload keys: %s", list(payload.keys()))
         
         user_id = payload['user']['id']
         user_name = bot.get_user_name(user_id)
         values = payload['view']['state']['values']
         
-        print(f"🔍 DEBUG: Processing resolution for user: {user_name} ({user_id})")
+        logger.debug("Processing resolution for user: %s (%s)", user_name, user_id)
         
         # Extract form data
         resolution_notes = values.get('resolution_notes', {}).get('resolution_notes_input', {}).get('value', '').strip()
-        print(f"🔍 DEBUG: Resolution notes: {resolution_notes}")
+        logger.debug("Resolution notes: %s", resolution_notes)
         
         # Parse private_metadata: 24hr_resolution_user_id_kr_name
         private_metadata = payload['view']['private_metadata']
@@ -3744,10 +3810,10 @@ def handle_24hr_resolution_submission(bot, payload):
             def process_resolution_in_background():
                 try:
                     if bot.coda:
-                        print(f"🔍 DEBUG: Background processing - saving 24-hour blocker resolution for KR: {kr_name}")
+                        logger.debug("Background processing - saving 24-hour blocker resolution for KR: %s", kr_name)
                         
                         # STEP 1: Find the existing blocker and update its Resolution column
-                        print(f"🔍 DEBUG: Step 1 - Finding existing blocker and updating Resolution column")
+                        logger.debug("Step 1 - Finding existing blocker and updating Resolution column")
                         
                         try:
                             # Search for the existing blocker in the blocker table
@@ -3759,7 +3825,7 @@ def handle_24hr_resolution_submission(bot, payload):
                                 blocker_row_id = blocker_row.get('id')
                                 
                                 if blocker_row_id:
-                                    print(f"🔍 DEBUG: Found existing blocker row ID: {blocker_row_id}")
+                                    logger.debug("Found existing blocker row ID: %s", blocker_row_id)
                                     # Update the Resolution column for this blocker
                                     success = bot.coda.mark_blocker_complete(
                                         row_id=blocker_row_id,
@@ -3778,7 +3844,7 @@ def handle_24hr_resolution_submission(bot, payload):
                                     bot.send_dm(user_id, f"⚠️ Could not find blocker record for {kr_name}")
                             else:
                                 print(f"⚠️ No existing blocker found for KR: {kr_name}")
-                                print(f"🔍 DEBUG: KR name being searched: '{kr_name}'")
+                                logger.debug("KR name being searched: '%s'", kr_name)
                                 bot.send_dm(user_id, f"⚠️ No existing blocker found for {kr_name}")
                                 
                         except Exception as blocker_error:
@@ -3786,7 +3852,7 @@ def handle_24hr_resolution_submission(bot, payload):
                             bot.send_dm(user_id, f"❌ Error updating blocker: {blocker_error}")
                         
                         # STEP 2: Try to update KR status (optional - blocker table is the primary record)
-                        print(f"🔍 DEBUG: Step 2 - Attempting to update KR status")
+                        logger.debug("Step 2 - Attempting to update KR status")
                         try:
                             kr_success = bot.coda.resolve_blocker_from_kr(
                                 kr_name=kr_name,
@@ -3824,10 +3890,8 @@ def handle_24hr_resolution_submission(bot, payload):
         # Return immediately to close the modal
         return {"response_action": "clear"}
         
-    except Exception as e:
-        print(f"❌ Error in handle_24hr_resolution_submission: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error in handle_24hr_resolution_submission")
         return {"response_action": "clear"}
         bot.send_dm(user_id, "❌ Error processing 24-hour resolution. Please try again.")
         return {
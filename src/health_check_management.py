@@ -1,6 +1,95 @@
 import time
 from datetime import datetime
 from slack_sdk.errors import SlackApiError
+from .utils import Deduplicator
+
+# Static health check Block Kit payloads, built once at import instead of per send
+_HEALTH_CHECK_ACTIONS = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "😊 Great",
+                "emoji": True
+            },
+            "value": "great",
+            "action_id": "health_check_great"
+        },
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "😐 Okay",
+                "emoji": True
+            },
+            "value": "okay",
+            "action_id": "health_check_okay"
+        },
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "😔 Not Great",
+                "emoji": True
+            },
+            "value": "not_great",
+            "action_id": "health_check_not_great"
+        },
+        {
+            "type": "button",
+            "text": {
+                "type": "plain_text",
+                "text": "😤 Stressed",
+                "emoji": True
+            },
+            "value": "stressed",
+            "action_id": "health_check_stressed"
+        }
+    ]
+}
+
+_HEALTH_CHECK_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "🌡️ *How are you feeling today?*\n\nPlease select your current mood:"
+        }
+    },
+    _HEALTH_CHECK_ACTIONS
+]
+
+_TEST_HEALTH_CHECK_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "🧪 *Test Health Check*\n\nThis is a test health check message to verify the bot is working."
+        }
+    },
+    _HEALTH_CHECK_ACTIONS
+]
+
+_HEALTH_EXPLANATION_INPUT = {
+    "type": "input",
+    "block_id": "health_check_explanation",
+    "element": {
+        "type": "plain_text_input",
+        "action_id": "explanation_input",
+        "multiline": True,
+        "placeholder": {
+            "type": "plain_text",
+            "text": "Share your thoughts, feelings, or any context that might help us understand better..."
+        }
+    },
+    "label": {
+        "type": "plain_text",
+        "text": "Why do you feel this way?",
+        "emoji": True
+    }
+}
 
 
 class HealthCheckManager:
@@ -9,66 +98,15 @@ class HealthCheckManager:
     def __init__(self, bot):
         """Initialize the health check manager."""
         self.bot = bot
-        self.health_check_responses = set()
+        # One health check answer per user/message/day; Redis-backed when REDIS_URL is set.
+        # Its own prefix, so keys don't collide with the bot's 'hc' dedup in Redis
+        self.health_check_responses = Deduplicator('hc_answer', ttl_seconds=86400)
     
     def send_health_check_to_dm(self, user_id):
         """Send a health check message to a user's DM."""
         try:
-            # Create health check message blocks
-            blocks = [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "🌡️ *How are you feeling today?*\n\nPlease select your current mood:"
-                    }
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😊 Great",
-                                "emoji": True
-                            },
-                            "value": "great",
-                            "action_id": "health_check_great"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😐 Okay",
-                                "emoji": True
-                            },
-                            "value": "okay",
-                            "action_id": "health_check_okay"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😔 Not Great",
-                                "emoji": True
-                            },
-                            "value": "not_great",
-                            "action_id": "health_check_not_great"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😤 Stressed",
-                                "emoji": True
-                            },
-                            "value": "stressed",
-                            "action_id": "health_check_stressed"
-                        }
-                    ]
-                }
-            ]
+            # Create health check message blocks (prebuilt at import)
+            blocks = _HEALTH_CHECK_BLOCKS
             
             # Send the health check message
             response = self.bot.client.chat_postMessage(
@@ -91,61 +129,8 @@ class HealthCheckManager:
     def send_test_health_check(self):
         """Send a test health check to the main channel."""
         try:
-            # Create test health check message
-            blocks = [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "🧪 *Test Health Check*\n\nThis is a test health check message to verify the bot is working."
-                    }
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😊 Great",
-                                "emoji": True
-                            },
-                            "value": "great",
-                            "action_id": "health_check_great"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😐 Okay",
-                                "emoji": True
-                            },
-                            "value": "okay",
-                            "action_id": "health_check_okay"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😔 Not Great",
-                                "emoji": True
-                            },
-                            "value": "not_great",
-                            "action_id": "health_check_not_great"
-                        },
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "😤 Stressed",
-                                "emoji": True
-                            },
-                            "value": "stressed",
-                            "action_id": "health_check_stressed"
-                        }
-                    ]
-                }
-            ]
+            # Create test health check message (prebuilt at import)
+            blocks = _TEST_HEALTH_CHECK_BLOCKS
             
             # Send to main channel
             response = self.bot.client.chat_postMessage(
@@ -171,14 +156,13 @@ class HealthCheckManager:
             # Create a unique key for this response
             response_key = f"{user_id}_{response_value}_{message_ts}"
             
-            # Check if user already responded
-            if response_key in self.bot.health_check_responses:
+            # Check if user already responded (atomically marks the response as seen)
+            if not self.health_check_responses.check_and_add(response_key):
                 print(f"⚠️ User {user_id} already responded to health check")
                 return False
             
             # Get user info
-            user_info = self.bot.client.users_info(user=user_id)
-            username = user_info['user']['real_name']
+            username = self.bot.get_user(user_id)['real_name']
             
             # Store response and mark user as responded
             success = False
@@ -199,8 +183,6 @@ class HealthCheckManager:
             if not success:
                 print("❌ Failed to store health check response in Coda")
             
-            self.bot.health_check_responses.add(response_key)
-            
             # Send follow-up prompt asking why they feel that way
             followup_prompt_blocks = [
                 {
@@ -210,24 +192,7 @@ class HealthCheckManager:
                         "text": f"Thanks for your response! Could you tell us a bit more about why you're feeling {response_value.replace('_', ' ')} today?"
                     }
                 },
-                {
-                    "type": "input",
-                    "block_id": "health_check_explanation",
-                    "element": {
-                        "type": "plain_text_input",
-                        "action_id": "explanation_input",
-                        "multiline": True,
-                        "placeholder": {
-                            "type": "plain_text",
-                            "text": "Share your thoughts, feelings, or any context that might help us understand better..."
-                        }
-                    },
-                    "label": {
-                        "type": "plain_text",
-                        "text": "Why do you feel this way?",
-                        "emoji": True
-                    }
-                },
+                _HEALTH_EXPLANATION_INPUT,
                 {
                     "type": "actions",
                     "elements": [
@@ -274,8 +239,7 @@ class HealthCheckManager:
         """Handle health check explanation submission."""
         try:
             # Get user info
-            user_info = self.bot.client.users_info(user=user_id)
-            username = user_info['user']['real_name']
+            username = self.bot.get_user(user_id)['real_name']
             
             # Store the explanation in Coda if available
             if self.bot.coda and self.bot.coda.health_check_table_id:
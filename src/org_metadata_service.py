@@ -5,7 +5,7 @@ import time
 from typing import Dict, List, Optional, Tuple
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-from .utils import logger, error_handler, input_validator, safe_executor
+from .utils import logger, error_handler, input_validator, safe_executor, TTLDict
 
 class OrgMetadataService:
     """
@@ -71,6 +71,8 @@ class OrgMetadataService:
         # Cache for user metadata
         self._user_metadata_cache = {}
         self._user_metadata_cache_time = {}
+        # Raw users.info records by user ID, shared by every topic's metadata lookup
+        self._user_info_cache = TTLDict(maxsize=2048, ttl_seconds=self.cache_ttl)
         
     def get_user_department_and_sme(self, user_id: str, topic: str = None) -> Dict[str, str]:
         """
@@ -221,8 +223,12 @@ class OrgMetadataService:
     
     def _get_user_info_with_metadata(self, user_id: str) -> Optional[Dict]:
         """Get user info including custom profile fields."""
+        user_info = self._user_info_cache.get(user_id)
+        if user_info is not None:
+            return user_info
         try:
             response = self.client.users_info(user=user_id)
+            self._user_info_cache[user_id] = response['user']
             return response['user']
         except SlackApiError as e:
             logger.error(f"Error getting user info: {e}")
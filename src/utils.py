@@ -1,9 +1,18 @@
+import copy
+import dataclasses
 import logging
 import traceback
 import json
+import re
+import time
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional
 import os
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
 
 class BotLogger:
     """Centralized logging utility for the Slack bot."""
@@ -31,13 +40,14 @@ class BotLogger:
         file_handler.setFormatter(formatter)
         self.logger.addHandler(file_handler)
     
-    def info(self, message: str, **kwargs):
+    # Positional args are %-formatted lazily, only when the level is enabled
+    def info(self, message: str, *args, **kwargs):
         """Log info message."""
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, *args, extra=kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, *args, extra=kwargs)
     
     def error(self, message: str, error: Optional[Exception] = None, **kwargs):
         """Log error message with optional exception details."""
@@ -51,9 +61,13 @@ class BotLogger:
         
         self.logger.error(message, extra=kwargs)
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, *args, extra=kwargs)
+    
+    def exception(self, message: str, *args, **kwargs):
+        """Log error message with the current exception's traceback."""
+        self.logger.exception(message, *args, extra=kwargs)
 
 class ErrorHandler:
     """Centralized error handling for the bot."""
@@ -153,6 +167,11 @@ class ErrorHandler:
             'error_type': 'unexpected_error'
         }
 
+# Compiled once at import; InputValidator runs on every submitted payload
+_CHANNEL_PREFIXES = frozenset('CDG')
+_SCRIPT_TAG_RE = re.compile(r'</?script>', re.IGNORECASE)
+_MESSAGE_TS_RE = re.compile(r'\d+(?:\.\d+)?')
+
 class InputValidator:
     """Validate and sanitize bot inputs."""
     
@@ -168,18 +187,14 @@ class InputValidator:
         """Validate Slack channel ID format."""
         if not channel_id:
             return False
-        return channel_id.startswith(('C', 'D', 'G')) and len(channel_id) > 1
+        return channel_id[0] in _CHANNEL_PREFIXES and len(channel_id) > 1
     
     @staticmethod
     def validate_message_ts(ts: str) -> bool:
         """Validate Slack message timestamp format."""
         if not ts:
             return False
-        try:
-            float(ts)
-            return True
-        except ValueError:
-            return False
+        return _MESSAGE_TS_RE.fullmatch(ts) is not None
     
     @staticmethod
     def sanitize_text(text: str, max_length: int = 3000) -> str:
@@ -187,8 +202,8 @@ class InputValidator:
         if not text:
             return ""
         
-        # Remove potentially dangerous characters
-        sanitized = text.replace('<script>', '').replace('</script>', '')
+        # Remove potentially dangerous characters (both tags in one pass)
+        sanitized = _SCRIPT_TAG_RE.sub('', text)
         
         # Truncate if too long
         if len(sanitized) > max_length:
@@ -207,6 +222,472 @@ class InputValidator:
         
         return len(missing_fields) == 0, missing_fields
 
+class Deduplicator:
+    """Remember keys for a limited time so repeated events can be skipped.
+    
+    Uses Redis (SET NX EX) when REDIS_URL is configured, so dedup state survives
+    restarts and is shared between processes. Otherwise falls back to an
+    in-process OrderedDict of key -> expiry time, which stays bounded by max_entries.
+    Supports `key in dedup`, `dedup.add(key)` and `dedup.discard(key)` like the sets it replaces.
+    """
+    
+    def __init__(self, prefix: str, ttl_seconds: int = 300, max_entries: int = 10000, redis_url: str = None):
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._local = OrderedDict()
+        self._local_lock = threading.Lock()
+        self._redis = None
+        
+        redis_url = redis_url or os.environ.get("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(redis_url)
+            except ImportError:
+                logger.warning("REDIS_URL is set but the redis package is not installed - using in-memory dedup")
+    
+    def _redis_key(self, key) -> str:
+        return f"{self.prefix}:{key}"
+    
+    def _purge_expired(self, now: float):
+        """Drop expired keys, then the oldest ones if still over max_entries.
+        
+        Every key gets the same TTL and is moved to the end when re-added, so
+        expiry order is insertion order and only the front needs checking.
+        """
+        while self._local:
+            oldest_key, expires_at = next(iter(self._local.items()))
+            if expires_at > now and len(self._local) < self.max_entries:
+                break
+            self._local.popitem(last=False)
+    
+    def check_and_add(self, key) -> bool:
+        """Record key and return True if it is new, False if it was already seen."""
+        if self._redis is not None:
+            try:
+                is_new = bool(self._redis.set(self._redis_key(key), "1", nx=True, ex=self.ttl_seconds))
+                if is_new:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                return is_new
+            except Exception as e:
+                logger.warning("Redis dedup unavailable, using in-memory fallback: %s", e)
+        
+        # Lookup and insert under one lock so concurrent handlers can't both see a key as new
+        with self._local_lock:
+            now = time.time()
+            expires_at = self._local.get(key)
+            if expires_at is not None and expires_at > now:
+                self.hits += 1
+                return False
+            
+            self._purge_expired(now)
+            self._local.pop(key, None)
+            self._local[key] = now + self.ttl_seconds
+            self.misses += 1
+            return True
+    
+    def add(self, key):
+        """Mark key as seen."""
+        self.check_and_add(key)
+    
+    def discard(self, key):
+        """Forget key, so a failed attempt after check_and_add can be retried."""
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._redis_key(key))
+            except Exception as e:
+                logger.warning("Redis dedup unavailable, using in-memory fallback: %s", e)
+        
+        # Also clear the local copy, which check_and_add uses when Redis is down
+        with self._local_lock:
+            self._local.pop(key, None)
+    
+    def __contains__(self, key) -> bool:
+        if self._redis is not None:
+            try:
+                return bool(self._redis.exists(self._redis_key(key)))
+            except Exception as e:
+                logger.warning("Redis dedup unavailable, using in-memory fallback: %s", e)
+        
+        expires_at = self._local.get(key)
+        return expires_at is not None and expires_at > time.time()
+
+# Dataclasses a Redis-backed TTLDict may store, by class name (see register_json_type)
+_JSON_TYPES = {}
+
+def register_json_type(cls):
+    """Class decorator that lets a dataclass be stored in a Redis-backed TTLDict."""
+    _JSON_TYPES[cls.__name__] = cls
+    return cls
+
+def _json_default(obj):
+    """Encode the non-JSON values TTLDict stores: datetimes and registered dataclasses."""
+    if isinstance(obj, datetime):
+        return {'__datetime__': obj.isoformat()}
+    if _JSON_TYPES.get(type(obj).__name__) is type(obj):
+        return {
+            '__type__': type(obj).__name__,
+            'fields': {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        }
+    raise TypeError(f"{type(obj).__name__} can't be stored in Redis; register it with register_json_type")
+
+def _json_object_hook(d):
+    """Inverse of _json_default."""
+    if '__datetime__' in d:
+        return datetime.fromisoformat(d['__datetime__'])
+    cls = _JSON_TYPES.get(d.get('__type__'))
+    if cls is not None:
+        return cls(**d['fields'])
+    return d
+
+class TTLDict(MutableMapping):
+    """Dict whose entries expire after ttl_seconds, capped at maxsize entries.
+    
+    Entries are kept in insertion order, so both expiry and overflow eviction
+    drop from the oldest end. Expired entries are skipped on read and iteration.
+    All operations hold an internal lock, since Socket Mode handlers run on
+    several worker threads; items() and values() return snapshots.
+    
+    When a prefix is given and REDIS_URL is configured, entries are stored in
+    Redis instead (as JSON, with SET EX for the TTL) so they are shared between
+    processes and survive restarts; Redis expiry then replaces maxsize. Values
+    must then be JSON-encodable apart from datetimes and register_json_type
+    dataclasses (dict keys come back as strings). Reads return copies in that
+    mode, so use mutate() to change a stored value in place.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl_seconds: int = 86400, prefix: str = None, redis_url: str = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._data = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.RLock()
+        self._redis = None
+        self._watch_error = None
+        
+        redis_url = redis_url or os.environ.get("REDIS_URL")
+        if prefix and redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(redis_url)
+                self._watch_error = redis.WatchError
+            except ImportError:
+                logger.warning("REDIS_URL is set but the redis package is not installed - keeping %s in memory", prefix)
+    
+    def _redis_key(self, key) -> str:
+        return f"{self.prefix}:{key}"
+    
+    @staticmethod
+    def _dumps(value) -> str:
+        return json.dumps(value, default=_json_default)
+    
+    @staticmethod
+    def _loads(raw):
+        return json.loads(raw, object_hook=_json_object_hook)
+    
+    def _redis_keys(self) -> list:
+        start = len(self.prefix) + 1
+        return [k.decode()[start:] for k in self._redis.scan_iter(match=f"{self.prefix}:*", count=1000)]
+    
+    def _redis_failed(self, e):
+        logger.warning("Redis %s store unavailable, using in-memory fallback: %s", self.prefix, e)
+    
+    def __getitem__(self, key):
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(self._redis_key(key))
+            except Exception as e:
+                self._redis_failed(e)
+            else:
+                if raw is None:
+                    raise KeyError(key)
+                return self._loads(raw)
+        
+        with self._lock:
+            value, expires_at = self._data[key]
+            if expires_at <= time.time():
+                del self._data[key]
+                raise KeyError(key)
+            return value
+    
+    def __setitem__(self, key, value):
+        if self._redis is not None:
+            try:
+                self._redis.set(self._redis_key(key), self._dumps(value), ex=self.ttl_seconds)
+                return
+            except Exception as e:
+                self._redis_failed(e)
+        
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, time.time() + self.ttl_seconds)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __delitem__(self, key):
+        if self._redis is not None:
+            try:
+                deleted = self._redis.delete(self._redis_key(key))
+            except Exception as e:
+                self._redis_failed(e)
+            else:
+                if not deleted:
+                    raise KeyError(key)
+                return
+        
+        with self._lock:
+            del self._data[key]
+    
+    def __iter__(self):
+        if self._redis is not None:
+            try:
+                return iter(self._redis_keys())
+            except Exception as e:
+                self._redis_failed(e)
+        
+        with self._lock:
+            self.expire()
+            return iter(list(self._data))
+    
+    def __len__(self):
+        if self._redis is not None:
+            try:
+                return len(self._redis_keys())
+            except Exception as e:
+                self._redis_failed(e)
+        
+        with self._lock:
+            self.expire()
+            return len(self._data)
+    
+    def setdefault(self, key, default=None):
+        """Return the live value for key, inserting default first if absent (atomically)."""
+        if self._redis is not None:
+            try:
+                if self._redis.set(self._redis_key(key), self._dumps(default), nx=True, ex=self.ttl_seconds):
+                    return default
+                raw = self._redis.get(self._redis_key(key))
+                if raw is not None:
+                    return self._loads(raw)
+            except Exception as e:
+                self._redis_failed(e)
+        
+        with self._lock:
+            try:
+                return self[key]
+            except KeyError:
+                self[key] = default
+                return default
+    
+    def mutate(self, key, func, default=None):
+        """Atomically apply func to the value for key, store it and return func's result.
+        
+        func changes the value in place. If key is absent it gets a copy of default,
+        or KeyError is raised when default is None. In Redis mode this is a
+        WATCH/MULTI transaction retried on conflict, so concurrent read-modify-writes
+        from several processes don't overwrite each other's changes.
+        """
+        if self._redis is not None:
+            try:
+                return self._redis_mutate(key, func, default)
+            except KeyError:
+                raise
+            except Exception as e:
+                self._redis_failed(e)
+        
+        with self._lock:
+            try:
+                value = self[key]
+            except KeyError:
+                if default is None:
+                    raise
+                value = copy.deepcopy(default)
+            result = func(value)
+            self[key] = value
+            return result
+    
+    def _redis_mutate(self, key, func, default):
+        redis_key = self._redis_key(key)
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(redis_key)
+                    raw = pipe.get(redis_key)
+                    if raw is None:
+                        if default is None:
+                            raise KeyError(key)
+                        value = copy.deepcopy(default)
+                    else:
+                        value = self._loads(raw)
+                    result = func(value)
+                    pipe.multi()
+                    pipe.set(redis_key, self._dumps(value), ex=self.ttl_seconds)
+                    pipe.execute()
+                    return result
+                except self._watch_error:
+                    # Another process changed the key between WATCH and EXEC; re-read and retry
+                    continue
+    
+    def items(self):
+        """Snapshot of the live (key, value) pairs."""
+        if self._redis is not None:
+            try:
+                keys = self._redis_keys()
+                raws = self._redis.mget([self._redis_key(key) for key in keys]) if keys else []
+                return [(key, self._loads(raw)) for key, raw in zip(keys, raws) if raw is not None]
+            except Exception as e:
+                self._redis_failed(e)
+        
+        with self._lock:
+            self.expire()
+            return [(key, value) for key, (value, _) in self._data.items()]
+    
+    def values(self):
+        """Snapshot of the live values."""
+        return [value for _, value in self.items()]
+    
+    def expire(self):
+        """Drop every entry whose TTL has passed (Redis expires its own keys)."""
+        with self._lock:
+            now = time.time()
+            while self._data:
+                _, expires_at = next(iter(self._data.values()))
+                if expires_at > now:
+                    break
+                self._data.popitem(last=False)
+
+class RateLimiter:
+    """Per-key token bucket plus an AIMD cap on concurrent calls.
+    
+    Each key (e.g. a Slack channel) gets `rate` calls per second with bursts of
+    up to `burst`. The number of calls in flight starts at max_concurrency, is
+    halved whenever a call is throttled and grows back by 0.5 per success.
+    """
+    
+    def __init__(self, rate: float = 1.0, burst: int = 1, max_concurrency: int = 8, max_keys: int = 1024):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_keys = max_keys
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._buckets = {}  # key -> (tokens, last_refill)
+        self._cond = threading.Condition()
+    
+    def acquire(self, key):
+        """Block until a call for key may proceed.
+        
+        The key's token is taken before an in-flight slot, so calls sleeping on
+        one busy channel don't hold slots that other channels could use.
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                tokens, last_refill = self._buckets.get(key, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last_refill) * self.rate)
+                if tokens >= 1:
+                    self._buckets[key] = (tokens - 1, now)
+                    break
+                self._buckets[key] = (tokens, now)
+                self._cond.wait((1 - tokens) / self.rate)
+            
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            
+            # Forget buckets that have been idle long enough to be full again
+            if len(self._buckets) > self.max_keys:
+                idle_after = self.burst / self.rate
+                self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < idle_after}
+    
+    def release(self, throttled: bool = False):
+        """Finish a call; throttled=True applies the multiplicative decrease."""
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self._limit = max(1.0, self._limit * 0.5)
+            else:
+                self._limit = min(float(self.max_concurrency), self._limit + 0.5)
+            self._cond.notify_all()
+
+class RateLimitedWebClient(WebClient):
+    """WebClient whose chat_postMessage calls go through a per-channel RateLimiter.
+    
+    Slack allows roughly one message per second per channel; on HTTP 429 the
+    call waits for Retry-After and is retried up to max_retries times.
+    """
+    
+    def __init__(self, *args, rate_limiter: RateLimiter = None, max_retries: int = 2, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+    
+    def chat_postMessage(self, *, channel: str, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(channel)
+            throttled = False
+            try:
+                return super().chat_postMessage(channel=channel, **kwargs)
+            except SlackApiError as e:
+                throttled = e.response.status_code == 429
+                if not throttled or attempt >= self.max_retries:
+                    raise
+                retry_after = int(e.response.headers.get('Retry-After', 1))
+            finally:
+                # Always give the slot back, including on timeouts and connection errors
+                self.rate_limiter.release(throttled=throttled)
+            time.sleep(retry_after)
+
+def enable_fast_slack_json():
+    """Use orjson for slack_sdk's JSON work when it is installed.
+    
+    Web API request bodies (blocks included) are serialized with orjson, which
+    returns bytes the client sends as-is, and Web API responses and incoming
+    Socket Mode envelopes are parsed with orjson.loads. Socket Mode acks keep
+    the stdlib encoder because the websocket layer sends str frames.
+    Returns True if orjson was enabled.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return False
+    
+    from slack_sdk.web import base_client
+    from slack_sdk.socket_mode import client as socket_mode_client
+    
+    class _OrjsonJson:
+        """Stand-in for the json module inside a slack_sdk module."""
+        
+        def __init__(self, fast_dumps):
+            self._fast_dumps = fast_dumps
+        
+        def __getattr__(self, name):
+            return getattr(json, name)
+        
+        def dumps(self, obj, **kwargs):
+            if self._fast_dumps and not kwargs:
+                try:
+                    return orjson.dumps(obj)
+                except TypeError:
+                    pass
+            return json.dumps(obj, **kwargs)
+        
+        @staticmethod
+        def loads(s, **kwargs):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handlers still match
+            if not kwargs:
+                return orjson.loads(s)
+            return json.loads(s, **kwargs)
+    
+    base_client.json = _OrjsonJson(fast_dumps=True)
+    socket_mode_client.json = _OrjsonJson(fast_dumps=False)
+    return True
+
 class SafeExecutor:
     """Safely execute functions with error handling."""
     
@@ -1,10 +1,51 @@
 import pytest
 from unittest.mock import Mock, MagicMock
+import importlib.util
 import os
 import sys
+import types
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+# Register the src package without running src/__init__.py (which imports the
+# whole bot), so modules with relative imports such as src.standup_management
+# can be tested on their own
+if 'src' not in sys.modules:
+    _src_spec = importlib.util.spec_from_file_location(
+        'src', os.path.join(SRC_DIR, '__init__.py'), submodule_search_locations=[SRC_DIR]
+    )
+    sys.modules['src'] = importlib.util.module_from_spec(_src_spec)
+
+def _load_src_module(name):
+    """Import src.<name>, decoding UTF-16 sources that the normal importer rejects."""
+    full_name = f'src.{name}'
+    if full_name in sys.modules:
+        return sys.modules[full_name]
+    
+    path = os.path.join(SRC_DIR, f'{name}.py')
+    with open(path, 'rb') as f:
+        raw = f.read()
+    # Some modules (standup_management, scheduling, ...) are stored as UTF-16 with a BOM
+    source = raw.decode('utf-16') if raw.startswith((b'\xff\xfe', b'\xfe\xff')) else raw.decode('utf-8')
+    
+    module = types.ModuleType(full_name)
+    module.__file__ = path
+    module.__package__ = 'src'
+    sys.modules[full_name] = module
+    try:
+        exec(compile(source, path, 'exec'), module.__dict__)
+    except Exception:
+        del sys.modules[full_name]
+        raise
+    return module
+
+@pytest.fixture(scope='session')
+def load_src_module():
+    """Return a loader for src modules, including the UTF-16 encoded ones."""
+    return _load_src_module
 
 @pytest.fixture
 def mock_slack_client():
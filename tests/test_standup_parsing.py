@@ -0,0 +1,130 @@
+"""
+Unit Tests for standup reply parsing
+
+Tests how StandupManager reads a standup reply:
+- Positional and "Label: value" parsing of the three standup fields
+- on_track / blockers detection, pinned against the original substring check
+"""
+
+import pytest
+
+
+# The phrase lists and substring check the word sets replaced
+_OLD_NOT_ON_TRACK_PHRASES = [
+    'no', 'not on track', 'not on', 'behind', 'off track', 'off',
+    'not track', 'not meeting', 'not going well', 'struggling',
+    'falling behind', 'behind schedule', 'delayed', 'late'
+]
+_OLD_BLOCKER_PHRASES = [
+    'yes', 'blocker', 'blocked', 'stuck', 'issue', 'problem', 'yes i have',
+    'have blocker', 'need help', 'help', 'trouble', 'difficulty',
+    'challenge', 'obstacle', 'impediment', 'barrier'
+]
+
+
+def _old_not_on_track(text):
+    return any(phrase in text for phrase in _OLD_NOT_ON_TRACK_PHRASES)
+
+
+def _old_has_blockers(text):
+    return any(phrase in text for phrase in _OLD_BLOCKER_PHRASES)
+
+
+@pytest.fixture
+def StandupManager(load_src_module):
+    """StandupManager class (standup_management.py is UTF-16, so load it via conftest)."""
+    return load_src_module('standup_management').StandupManager
+
+
+class TestStandupStatusDetection:
+    """Test class for on_track / blockers detection."""
+
+    @pytest.mark.parametrize('answer', [
+        'no', 'nope', 'not', 'not really', 'not yet', "i'm not sure",
+        'not on track', 'not going well', 'behind schedule', 'falling behind',
+        'off track', 'delayed', 'running late', 'struggling a bit',
+        'yes', 'y', 'on track', 'yes, all good', ''
+    ])
+    def test_on_track_matches_old_check(self, StandupManager, answer):
+        """Test that on_track answers give the same result as the old substring check."""
+        assert StandupManager.is_not_on_track(answer) == _old_not_on_track(answer)
+
+    @pytest.mark.parametrize('answer', [
+        'yes', 'yes, stuck on api keys', 'blocked by infra', 'two blockers',
+        'need help with deploys', 'some issues with ci', 'a problem with auth',
+        'having trouble', 'difficulty with tests', 'obstacle: access',
+        'none', 'no', 'n/a', 'nope, all clear', ''
+    ])
+    def test_blockers_match_old_check(self, StandupManager, answer):
+        """Test that blockers answers give the same result as the old substring check."""
+        assert StandupManager.has_blockers(answer) == _old_has_blockers(answer)
+
+    @pytest.mark.parametrize('answer, expected', [
+        # Stems inside unrelated words no longer count
+        ('i know what to do', False),
+        ('working from the office', False),
+        ('translate docs', False),
+        ('now on track', False),
+    ])
+    def test_on_track_whole_words_only(self, StandupManager, answer, expected):
+        """Test the intended differences: only whole words count."""
+        assert _old_not_on_track(answer) != expected
+        assert StandupManager.is_not_on_track(answer) == expected
+
+    @pytest.mark.parametrize('answer, expected', [
+        ('blocking on review', True),
+        ('challenging migration', True),
+        ('helpful pairing session', False),
+    ])
+    def test_blockers_word_forms(self, StandupManager, answer, expected):
+        """Test blocker word forms that the word set handles explicitly."""
+        assert StandupManager.has_blockers(answer) == expected
+
+
+class TestParseStandupResponse:
+    """Test class for parse_standup_response."""
+
+    @pytest.mark.parametrize('text, expected', [
+        # Plain positional reply
+        ('Worked on X\nyes\nnone',
+         {'today': 'worked on x', 'on_track': 'yes', 'blockers': 'none'}),
+        # Blank lines are ignored
+        ('\nWorked on X\n\n  yes  \nnone\n',
+         {'today': 'worked on x', 'on_track': 'yes', 'blockers': 'none'}),
+        # Missing lines leave fields empty
+        ('Worked on X',
+         {'today': 'worked on x', 'on_track': '', 'blockers': ''}),
+        ('', {'today': '', 'on_track': '', 'blockers': ''}),
+        # Fully labelled, any order
+        ('Blockers: none\nOn track: yes\nToday: Worked on X',
+         {'today': 'worked on x', 'on_track': 'yes', 'blockers': 'none'}),
+        # A Yesterday line does not use up a field
+        ('Yesterday: shipped Y\nToday: Worked on X\nOn track: yes\nBlockers: yes, stuck on API keys',
+         {'today': 'worked on x', 'on_track': 'yes', 'blockers': 'yes, stuck on api keys'}),
+        # Positional lines never overwrite a labelled field
+        ('Blockers: none\nWorked on X\nyes',
+         {'today': 'worked on x', 'on_track': 'yes', 'blockers': 'none'}),
+        # Positional lines fill the fields that are still empty, in order
+        ('Worked on X\nBlockers: stuck\nno',
+         {'today': 'worked on x', 'on_track': 'no', 'blockers': 'stuck'}),
+        # A colon in a positional line is kept as text
+        ('Fixed bug: login loop\nyes\nnone',
+         {'today': 'fixed bug: login loop', 'on_track': 'yes', 'blockers': 'none'}),
+    ])
+    def test_parse(self, StandupManager, text, expected):
+        """Test parsing of positional and labelled replies."""
+        assert StandupManager.parse_standup_response(text) == expected
+
+    def test_extra_lines_ignored(self, StandupManager):
+        """Test that lines after all three fields are set are ignored."""
+        text = 'Worked on X\nyes\nnone\n' + '\n'.join(f'log line {i}' for i in range(200))
+        assert StandupManager.parse_standup_response(text) == {
+            'today': 'worked on x', 'on_track': 'yes', 'blockers': 'none'
+        }
+
+    def test_label_after_line_cap_ignored(self, StandupManager):
+        """Test that labels are only looked for within the first few lines."""
+        text = 'Today: Worked on X\n' + '\n'.join(['Notes: n'] * 20) + '\nBlockers: yes'
+        parsed = StandupManager.parse_standup_response(text)
+        assert parsed['today'] == 'worked on x'
+        assert parsed['blockers'] == ''
@@ -0,0 +1,292 @@
+"""
+Unit Tests for the expiring containers in utils
+
+Tests TTLDict and Deduplicator:
+- Expiry order and maxsize / max_entries eviction
+- setdefault, mutate and check_and_add under concurrent callers
+- discard, so a failed attempt can be retried
+- The Redis-backed path (JSON values, cross-instance updates), when a Redis
+  server is reachable at REDIS_URL
+"""
+
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+import utils
+from utils import Deduplicator, TTLDict, register_json_type
+
+
+@register_json_type
+@dataclass
+class _Record:
+    followup_ts: str
+    parsed_data: dict
+
+
+class _Clock:
+    """Stand-in for utils.time whose time() only moves when advanced."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = _Clock()
+    with patch.object(utils, 'time', fake):
+        yield fake
+
+
+@pytest.fixture
+def no_redis(monkeypatch):
+    """Keep the containers in memory even if REDIS_URL is set in the environment."""
+    monkeypatch.delenv('REDIS_URL', raising=False)
+
+
+def _run_concurrently(target, count=20):
+    """Start count threads on target(i) together and wait for all of them."""
+    barrier = threading.Barrier(count)
+
+    def run(i):
+        barrier.wait()
+        target(i)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+@pytest.mark.usefixtures('no_redis')
+class TestTTLDict:
+    """Test class for the in-memory TTLDict."""
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test that expired entries are gone from reads, iteration and len."""
+        store = TTLDict(ttl_seconds=10)
+        store['a'] = 1
+        clock.advance(5)
+        store['b'] = 2
+
+        clock.advance(6)
+        assert 'a' not in store
+        assert store.get('a') is None
+        assert store['b'] == 2
+        assert list(store) == ['b']
+        assert len(store) == 1
+
+    def test_expire_drops_oldest_first(self, clock):
+        """Test that expiry follows insertion order, with re-set keys counting as new."""
+        store = TTLDict(ttl_seconds=10)
+        store['a'] = 1
+        clock.advance(1)
+        store['b'] = 2
+        clock.advance(1)
+        store['a'] = 3  # re-set: now the newest entry
+
+        clock.advance(9)
+        store.expire()
+        assert store.items() == [('a', 3)]
+
+    def test_maxsize_evicts_oldest(self, clock):
+        """Test that overflowing maxsize drops the least recently set keys."""
+        store = TTLDict(maxsize=3)
+        for key in 'abc':
+            store[key] = key
+        store['a'] = 'a2'
+        store['d'] = 'd'
+
+        assert list(store) == ['c', 'a', 'd']
+        assert store['a'] == 'a2'
+
+    def test_setdefault_is_atomic(self):
+        """Test that concurrent setdefault calls all get the one stored value."""
+        store = TTLDict()
+        returned = []
+
+        def add(i):
+            value = store.setdefault('k', [])
+            value.append(i)
+            returned.append(value)
+
+        _run_concurrently(add)
+
+        assert all(value is store['k'] for value in returned)
+        assert sorted(store['k']) == list(range(20))
+
+    def test_mutate_applies_every_update(self):
+        """Test that concurrent read-modify-writes through mutate don't lose updates."""
+        store = TTLDict()
+
+        def increment(_):
+            for _ in range(50):
+                store.mutate('counter', lambda value: value.__setitem__('n', value['n'] + 1), default={'n': 0})
+
+        _run_concurrently(increment)
+        assert store['counter'] == {'n': 1000}
+
+    def test_mutate_returns_result_and_copies_default(self):
+        """Test mutate's return value and that the default itself is never stored."""
+        store = TTLDict()
+        default = {'quick_responses': {}}
+
+        assert store.mutate('s', lambda value: value['quick_responses'].setdefault('U1', 'ok'), default=default) == 'ok'
+        assert store['s'] == {'quick_responses': {'U1': 'ok'}}
+        assert default == {'quick_responses': {}}
+
+    def test_mutate_missing_key_without_default(self):
+        """Test that mutate raises KeyError instead of creating an entry."""
+        store = TTLDict()
+        with pytest.raises(KeyError):
+            store.mutate('missing', lambda value: None)
+        assert 'missing' not in store
+
+    def test_json_round_trip(self):
+        """Test the encoding used for Redis values."""
+        value = {
+            'timestamp': datetime(2024, 5, 1, 9, 30),
+            'record': _Record(followup_ts='1.2', parsed_data={'on_track': 'yes'}),
+            'quick_responses': {'U1': {'status': 'good'}}
+        }
+        assert TTLDict._loads(TTLDict._dumps(value)) == value
+
+    def test_json_rejects_unregistered_types(self):
+        """Test that values Redis can't hold fail loudly instead of being pickled."""
+        with pytest.raises(TypeError):
+            TTLDict._dumps({'value': object()})
+
+
+@pytest.mark.usefixtures('no_redis')
+class TestDeduplicator:
+    """Test class for the in-memory Deduplicator."""
+
+    def test_check_and_add(self):
+        """Test first-seen / already-seen results and the hit counters."""
+        dedup = Deduplicator('test')
+        assert dedup.check_and_add('evt1') is True
+        assert dedup.check_and_add('evt1') is False
+        assert 'evt1' in dedup
+        assert (dedup.misses, dedup.hits) == (1, 1)
+
+    def test_keys_expire(self, clock):
+        """Test that a key can be added again once its TTL has passed."""
+        dedup = Deduplicator('test', ttl_seconds=10)
+        dedup.add('evt1')
+        clock.advance(11)
+        assert 'evt1' not in dedup
+        assert dedup.check_and_add('evt1') is True
+
+    def test_max_entries_evicts_oldest(self, clock):
+        """Test that the local store stays bounded by max_entries."""
+        dedup = Deduplicator('test', max_entries=3)
+        for key in ('a', 'b', 'c', 'd'):
+            dedup.add(key)
+
+        assert len(dedup._local) == 3
+        assert 'a' not in dedup
+        assert 'd' in dedup
+
+    def test_discard_allows_retry(self):
+        """Test that a discarded key is new again, and discarding twice is harmless."""
+        dedup = Deduplicator('test')
+        dedup.add('U1_2024-05-01')
+        dedup.discard('U1_2024-05-01')
+        dedup.discard('U1_2024-05-01')
+
+        assert 'U1_2024-05-01' not in dedup
+        assert dedup.check_and_add('U1_2024-05-01') is True
+
+    def test_check_and_add_is_atomic(self):
+        """Test that exactly one of many concurrent callers sees a key as new."""
+        dedup = Deduplicator('test')
+        results = []
+        _run_concurrently(lambda _: results.append(dedup.check_and_add('evt1')))
+        assert results.count(True) == 1
+
+
+@pytest.fixture
+def redis_url():
+    """URL of a live Redis server; the Redis-path tests skip without one."""
+    redis = pytest.importorskip('redis')
+    url = os.environ.get('REDIS_URL')
+    if not url:
+        pytest.skip('REDIS_URL is not set')
+    try:
+        redis.Redis.from_url(url).ping()
+    except redis.RedisError:
+        pytest.skip(f'No Redis server at {url}')
+    return url
+
+
+@pytest.fixture
+def prefix(redis_url):
+    """Unique key prefix, with its keys deleted after the test."""
+    import redis
+    value = f'test_{uuid.uuid4().hex}'
+    yield value
+    client = redis.Redis.from_url(redis_url)
+    for key in client.scan_iter(match=f'{value}:*'):
+        client.delete(key)
+
+
+class TestRedisBackend:
+    """Test class for the Redis-backed TTLDict and Deduplicator."""
+
+    def test_values_shared_between_instances(self, redis_url, prefix):
+        """Test that JSON values written by one instance are read back by another."""
+        writer = TTLDict(prefix=prefix, redis_url=redis_url)
+        reader = TTLDict(prefix=prefix, redis_url=redis_url)
+        value = {'timestamp': datetime(2024, 5, 1, 9, 30), 'record': _Record('1.2', {'today': 'x'})}
+
+        writer['ts1'] = value
+        assert reader['ts1'] == value
+        assert list(reader) == ['ts1']
+
+        del reader['ts1']
+        assert 'ts1' not in writer
+
+    def test_setdefault_keeps_existing_value(self, redis_url, prefix):
+        """Test that setdefault doesn't overwrite another instance's entry."""
+        first = TTLDict(prefix=prefix, redis_url=redis_url)
+        second = TTLDict(prefix=prefix, redis_url=redis_url)
+
+        assert first.setdefault('ts1', {'owner': 'first'}) == {'owner': 'first'}
+        assert second.setdefault('ts1', {'owner': 'second'}) == {'owner': 'first'}
+
+    def test_mutate_across_instances(self, redis_url, prefix):
+        """Test that WATCH/MULTI keeps concurrent updates from different instances."""
+        stores = [TTLDict(prefix=prefix, redis_url=redis_url) for _ in range(4)]
+
+        def add_response(i):
+            stores[i % 4].mutate(
+                'ts1', lambda value: value['quick_responses'].__setitem__(f'U{i}', 'good'),
+                default={'quick_responses': {}}
+            )
+
+        _run_concurrently(add_response)
+        assert len(stores[0]['ts1']['quick_responses']) == 20
+
+    def test_dedup_shared_between_instances(self, redis_url, prefix):
+        """Test check_and_add and discard through Redis."""
+        first = Deduplicator(prefix, redis_url=redis_url)
+        second = Deduplicator(prefix, redis_url=redis_url)
+
+        assert first.check_and_add('evt1') is True
+        assert second.check_and_add('evt1') is False
+
+        second.discard('evt1')
+        assert 'evt1' not in first
+        assert first.check_and_add('evt1') is True